@@ -182,8 +182,7 @@ class Demographic:
 
         subnet.name = self.name
 
-        subnet.reset_everything(nthreads=nthreads, profiler=profiler)
-        subnet.rescale_play_matrix(nthreads=nthreads, profiler=profiler)
+        subnet.reset_and_rescale(nthreads=nthreads, profiler=profiler)
         subnet.move_from_play_to_work(nthreads=nthreads, profiler=profiler)
 
         return subnet
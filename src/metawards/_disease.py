@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys as _sys
 from dataclasses import dataclass as _dataclass
 from typing import List as _List
 from typing import Dict as _Dict
@@ -9,6 +10,10 @@ __all__ = ["Disease"]
 
 _default_folder_name = "diseases"
 
+# use __slots__ for faster attribute access and smaller objects
+# on Python versions where dataclass supports creating them
+_dataclass_args = {"slots": True} if _sys.version_info >= (3, 10) else {}
+
 
 def _infer_mapping(stages):
     """Get the computed mapping names for each stage. This is the
@@ -29,7 +34,7 @@ def _infer_mapping(stages):
     return mapping
 
 
-@_dataclass
+@_dataclass(**_dataclass_args)
 class Disease:
     """This class holds the parameters about a single disease
 
@@ -132,15 +137,41 @@ class Disease:
                f"too_ill_to_move={self.too_ill_to_move})"
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        elif not isinstance(other, Disease):
+            return NotImplemented
+
+        # compare the cheap scalar first, before the per-stage lists
         return \
+            self.start_symptom == other.start_symptom and \
             self.stage == other.stage and \
             self.mapping == other.mapping and \
             self.beta == other.beta and \
             self.progress == other.progress and \
             self.too_ill_to_move == other.too_ill_to_move and \
             self.contrib_foi == other.contrib_foi and \
-            self.is_infected == other.is_infected and \
-            self.start_symptom == other.start_symptom
+            self.is_infected == other.is_infected
+
+    def copy(self):
+        """Return a copy of this disease. This copies the per-stage
+           lists (which hold only immutable values), and so is much
+           cheaper than a full deepcopy
+        """
+        from copy import copy
+        disease = copy(self)  # shallow copy
+
+        for key in ["stage", "mapping", "beta", "progress",
+                    "too_ill_to_move", "contrib_foi", "is_infected"]:
+            value = getattr(self, key)
+
+            if value is not None:
+                setattr(disease, key, list(value))
+
+        return disease
+
+    def __deepcopy__(self, memo):
+        return self.copy()
 
     def __len__(self):
         if self.beta:
@@ -271,9 +302,9 @@ class Disease:
         try:
             n = len(self.beta)
 
-            assert len(self.progress) == n
-            assert len(self.too_ill_to_move) == n
-            assert len(self.contrib_foi) == n
+            assert all(len(x) == n for x in (self.progress,
+                                             self.too_ill_to_move,
+                                             self.contrib_foi))
         except Exception as e:
             raise AssertionError(f"Data read for disease {self.name} "
                                  f"is corrupted! {e.__class__}: {e}")
@@ -734,9 +765,8 @@ class Disease:
         json_file = os.path.abspath(filename)
 
         try:
-            with open(json_file, "r") as FILE:
-                import json
-                data = json.load(FILE)
+            from .utils._read_json import read_json_file
+            data = read_json_file(json_file)
 
         except Exception as e:
             from .utils._console import Console
@@ -857,16 +887,8 @@ set the model data.""")
         import json
 
         if os.path.exists(s):
-            try:
-                import bz2
-                with bz2.open(s, "rt") as FILE:
-                    data = json.load(FILE)
-            except Exception:
-                data = None
-
-            if data is None:
-                with open(s, "rt") as FILE:
-                    data = json.load(FILE)
+            from .utils._read_json import read_json_file
+            data = read_json_file(s)
         else:
             try:
                 data = json.loads(s)
@@ -108,15 +108,33 @@ class Infections:
         elif isinstance(network, Networks):
             inf = Infections.build(network.overall)
 
-            subinfs = []
+            inf.subinfs = [Infections.build(subnet, overall=network)
+                           for subnet in network.subnets]
+            return inf
+
+    def _flatten(self):
+        """Collect together all of the work and play infection arrays
+           of this network and its demographic subnets into single
+           lists, so that they can all be processed together. This
+           is not cached, as the arrays can be reassigned after
+           the infections have been built
+        """
+        all_work = []
+        all_play = []
 
-            for subnet in network.subnets:
-                subinf = Infections.build(subnet, overall=network)
-                subinfs.append(subinf)
+        if self.work is not None:
+            all_work += self.work
 
-            inf.subinfs = subinfs
+        if self.play is not None:
+            all_play += self.play
 
-            return inf
+        if self.subinfs is not None:
+            for subinf in self.subinfs:
+                (sub_work, sub_play) = subinf._flatten()
+                all_work += sub_work
+                all_play += sub_play
+
+        return (all_work, all_play)
 
     def _set_stage_mapping(self, disease_params: Disease,
                            overall_params: Disease):
@@ -191,11 +209,9 @@ class Infections:
              Optionally parallelise this reset by specifying the number
              of threads to use
         """
+        (all_work, all_play) = self._flatten()
+
         from .utils import clear_all_infections
-        clear_all_infections(infections=self.work,
-                             play_infections=self.play,
+        clear_all_infections(infections=all_work,
+                             play_infections=all_play,
                              nthreads=nthreads)
-
-        if self.subinfs is not None:
-            for subinf in self.subinfs:
-                subinf.clear(nthreads=nthreads)
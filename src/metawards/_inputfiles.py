@@ -183,6 +183,22 @@ class InputFiles:
     def __hash__(self):
         return self._filename.__hash__()
 
+    def copy(self):
+        """Return a copy of these input files. All of the members
+           are immutable strings apart from lookup_columns, so this
+           is much cheaper than a full deepcopy
+        """
+        from copy import copy
+        input_files = copy(self)  # shallow copy
+
+        if self.lookup_columns is not None:
+            input_files.lookup_columns = dict(self.lookup_columns)
+
+        return input_files
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
     def _localise(self):
         """Localise the filenames in this input files set. This will
            prepend model_path/model to every filename and will also
@@ -302,17 +318,8 @@ class InputFiles:
                               _filename=json_file)
 
         try:
-            import json
-            try:
-                import bz2
-                with bz2.open(json_file, "rt") as FILE:
-                    files = json.load(FILE)
-            except Exception:
-                files = None
-
-            if files is None:
-                with open(json_file, "r") as FILE:
-                    files = json.load(FILE)
+            from .utils._read_json import read_json_file
+            files = read_json_file(json_file)
 
         except Exception as e:
             from .utils._console import Console
@@ -1,4 +1,6 @@
 
+import re as _re
+from datetime import date as _date
 from typing import Union as _Union
 
 __all__ = ["Interpret"]
@@ -6,6 +8,15 @@ __all__ = ["Interpret"]
 
 _Number = _Union[int, float]
 
+# regular expressions used to match requests for random integers
+# and numbers, e.g. "rand(1, 10)". These are compiled once, here,
+# as they are used whenever a value from a file is interpreted
+_random_integer_regex = _re.compile(
+    r"rand\(\s*(-?\d*)\s*\,?\s*(-?\d*)\s*\)", _re.IGNORECASE)
+
+_random_number_regex = _re.compile(
+    r"rand\(\s*([-?\d\.]*)\s*\,?\s*([-?\d\.]*)\s*\)", _re.IGNORECASE)
+
 
 def _clamp_range(val, minval, maxval):
     """Ensure that 'val' is clamped to between 'minval' and 'maxval'
@@ -44,10 +55,7 @@ class Interpret:
             rmin = None
             rmax = None
         else:
-            import re
-
-            m = re.search(r"rand\(\s*(-?\d*)\s*\,?\s*(-?\d*)\s*\)",
-                          Interpret.string(s), re.IGNORECASE)
+            m = _random_integer_regex.search(Interpret.string(s))
 
             if m is None:
                 raise ValueError(
@@ -108,10 +116,7 @@ class Interpret:
             rmin = None
             rmax = None
         else:
-            import re
-
-            m = re.search(r"rand\(\s*([-?\d\.]*)\s*\,?\s*([-?\d\.]*)\s*\)",
-                          Interpret.string(s), re.IGNORECASE)
+            m = _random_number_regex.search(Interpret.string(s))
 
             if m is None:
                 raise ValueError(
@@ -273,8 +278,7 @@ class Interpret:
         s = Interpret.string(s)
 
         try:
-            from datetime import date
-            d = date.fromisoformat(s)
+            d = _date.fromisoformat(s)
         except Exception:
             d = None
 
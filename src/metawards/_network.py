@@ -512,6 +512,16 @@ class Network:
         from .utils import rescale_play_matrix
         rescale_play_matrix(network=self, nthreads=nthreads, profiler=profiler)
 
+    def reset_and_rescale(self, nthreads: int = 1, profiler=None):
+        """Reset the network and then rescale the play matrix. This
+           is equivalent to calling reset_everything followed by
+           rescale_play_matrix, but processes the network in one go,
+           so that its arrays are still in cache for the rescale
+        """
+        from .utils import reset_everything, rescale_play_matrix
+        reset_everything(network=self, nthreads=nthreads, profiler=profiler)
+        rescale_play_matrix(network=self, nthreads=nthreads, profiler=profiler)
+
     def move_from_play_to_work(self, nthreads: int = 1,
                                profiler=None):
         """Move the population from play to work"""
@@ -519,6 +529,18 @@ class Network:
         move_population_from_play_to_work(network=self, nthreads=nthreads,
                                           profiler=profiler)
 
+    def run_function(self, func, infections, population, workspace,
+                     call_on_overall: bool = False,
+                     subnet_threads: int = 1, **kwargs):
+        """Call 'func' on this network, passing in the infections,
+           population and workspace, plus any other arguments.
+           'call_on_overall' and 'subnet_threads' are only used
+           by Networks, so are ignored here. This is called by
+           call_function_on_network
+        """
+        func(network=self, infections=infections,
+             population=population, workspace=workspace, **kwargs)
+
     def has_different_work_matrix(self):
         """Return whether or not the sub-network work matrix
            is different to that of the overall network
@@ -664,7 +686,8 @@ class Network:
              demographics. Not used by a single Network(used by Networks)
         """
         # Create the random number generator
-        from .utils._ran_binomial import seed_ran_binomial, ran_binomial
+        from .utils._ran_binomial import seed_ran_binomial, \
+            ran_binomial_batch
 
         if seed == 0:
             # this is a special mode that a developer can use to force
@@ -682,9 +705,7 @@ class Network:
         # Print the first five random numbers so that we can
         # compare to other codes/runs, and be sure that we are
         # generating the same random sequence
-        randnums = []
-        for i in range(0, 5):
-            randnums.append(str(ran_binomial(rng, 0.5, 100)))
+        randnums = [str(x) for x in ran_binomial_batch(rng, 0.5, 100, 5)]
 
         from .utils._console import Console
 
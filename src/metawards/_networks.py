@@ -5,6 +5,7 @@ from ._demographics import Demographics
 from ._parameters import Parameters
 from ._network import Network
 
+import atexit as _atexit
 from dataclasses import dataclass as _dataclass
 from dataclasses import field as _field
 from typing import List as _List
@@ -12,6 +13,57 @@ from typing import List as _List
 
 __all__ = ["Networks"]
 
+_null_profiler = None
+
+
+def _get_null_profiler():
+    """Return the shared NullProfiler. This holds no state, so a single
+       instance can be used rather than creating a new one on every call
+    """
+    global _null_profiler
+
+    if _null_profiler is None:
+        from .utils._profiler import NullProfiler
+        _null_profiler = NullProfiler()
+
+    return _null_profiler
+
+
+_thread_pool = None
+_thread_pool_size = 0
+
+
+def _get_thread_pool(nthreads: int):
+    """Return the shared pool of 'nthreads' threads that is used to
+       call functions on the demographic subnetworks at the same time.
+       This is created on first use (and re-created if the number of
+       threads changes), and is reused for every subsequent call, so
+       that new threads are not started for every stage of every day
+    """
+    global _thread_pool, _thread_pool_size
+
+    if _thread_pool is None or _thread_pool_size != nthreads:
+        _shutdown_thread_pool()
+
+        from concurrent.futures import ThreadPoolExecutor
+        _thread_pool = ThreadPoolExecutor(max_workers=nthreads)
+        _thread_pool_size = nthreads
+
+    return _thread_pool
+
+
+def _shutdown_thread_pool():
+    """Shut down the shared thread pool, if it has been created"""
+    global _thread_pool, _thread_pool_size
+
+    if _thread_pool is not None:
+        _thread_pool.shutdown()
+        _thread_pool = None
+        _thread_pool_size = 0
+
+
+_atexit.register(_shutdown_thread_pool)
+
 
 @_dataclass
 class Networks:
@@ -126,20 +178,38 @@ class Networks:
                 f"demographics.build(...)")
 
         if profiler is None:
-            from .utils._profiler import NullProfiler
-            profiler = NullProfiler()
+            profiler = _get_null_profiler()
 
         p = profiler.start("specialise")
 
-        subnets = []
+        ndemographics = len(demographics)
+
+        if nthreads is None or nthreads < 1:
+            nthreads = 1
+
+        # the demographics are specialised independently, so can be
+        # specialised at the same time. Divide the available threads
+        # between the demographics so that the OpenMP kernels called
+        # by each specialisation don't oversubscribe the cores
+        nworkers = min(ndemographics, nthreads)
+        subnet_nthreads = max(1, nthreads // nworkers)
+
+        def _specialise(i):
+            subp = p.start(f"demographic_{i}")
+            subnet = network.specialise(demographic=demographics[i],
+                                        profiler=subp,
+                                        nthreads=subnet_nthreads)
+            subp.stop()
+            return subnet
 
         # specialise the network for each demographic
-        for i in range(0, len(demographics)):
-            p = p.start(f"demographic_{i}")
-            subnets.append(network.specialise(demographic=demographics[i],
-                                              profiler=p,
-                                              nthreads=nthreads))
-            p = p.stop()
+        if nworkers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=nworkers) as pool:
+                # map preserves the order of the demographics
+                subnets = list(pool.map(_specialise, range(ndemographics)))
+        else:
+            subnets = [_specialise(i) for i in range(ndemographics)]
 
         p = p.start("distribute_remainders")
         from .utils._scale_susceptibles import distribute_remainders
@@ -151,8 +221,7 @@ class Networks:
         # we have changed the population, so need to recalculate the
         # denominators again...
         for subnet in subnets:
-            subnet.reset_everything(nthreads=nthreads, profiler=p)
-            subnet.rescale_play_matrix(nthreads=nthreads, profiler=p)
+            subnet.reset_and_rescale(nthreads=nthreads, profiler=p)
             subnet.move_from_play_to_work(nthreads=nthreads, profiler=p)
 
         p = p.stop()
@@ -166,11 +235,11 @@ class Networks:
                       f"workers: {network.work_population}, "
                       f"players: {network.play_population}")
 
-        for i, subnet in enumerate(subnets):
+        for demographic, subnet in zip(demographics, subnets):
             pop = subnet.population
             sum_pop += pop
 
-            Console.print(f"  {demographics[i].name} - population: {pop}, "
+            Console.print(f"  {demographic.name} - population: {pop}, "
                           f"workers: {subnet.work_population}, "
                           f"players: {subnet.play_population}")
 
@@ -280,15 +349,21 @@ class Networks:
            population: Population
              The final population at the end of the run
         """
-        # Create the random number generator
-        from .utils._ran_binomial import seed_ran_binomial, ran_binomial
+        # these cannot be imported at module level as metawards.utils
+        # itself imports this module
+        from .utils._ran_binomial import seed_ran_binomial, \
+            ran_binomial_batch
+        from .utils._parallel import get_available_num_threads, \
+            create_thread_generators
+        from .utils._run_model import run_model
+        from .utils._console import Console
 
+        # Create the random number generator
         if seed == 0:
             # this is a special mode that a developer can use to force
             # all jobs to use the same random number seed (15324) that
             # is used for comparing outputs. This should NEVER be used
             # for production code
-            from .utils._console import Console
             Console.warning("Using special mode to fix all random number "
                             "seeds to 15324. DO NOT USE IN PRODUCTION!!!")
             rng = seed_ran_binomial(seed=15324)
@@ -298,21 +373,16 @@ class Networks:
         # Print the first five random numbers so that we can
         # compare to other codes/runs, and be sure that we are
         # generating the same random sequence
-        randnums = []
-        for i in range(0, 5):
-            randnums.append(str(ran_binomial(rng, 0.5, 100)))
+        randnums = [str(x) for x in ran_binomial_batch(rng, 0.5, 100, 5)]
 
-        from .utils._console import Console
         Console.print(
-            f"* First five random numbers equal **{'**, **'.join(randnums)}",
+            f"* First five random numbers equal **{'**, **'.join(randnums)}**",
             markdown=True)
         randnums = None
 
         if nthreads is None:
-            from .utils._parallel import get_available_num_threads
             nthreads = get_available_num_threads()
 
-        from .utils._parallel import create_thread_generators
         rngs = create_thread_generators(rng, nthreads)
 
         # Create space to hold the results of the simulation
@@ -320,7 +390,6 @@ class Networks:
 
         Console.rule("Running the model")
 
-        from .utils import run_model
         population = run_model(network=self,
                                population=population,
                                infections=infections,
@@ -371,8 +440,7 @@ class Networks:
              Demographics
         """
         if profiler is None:
-            from .utils import NullProfiler
-            profiler = NullProfiler()
+            profiler = _get_null_profiler()
 
         p = profiler.start("overall.update")
         self.overall.update(params, profiler=p)
@@ -397,19 +465,29 @@ class Networks:
                 p.stop()
                 return networks
 
-        for i in range(0, len(self.demographics)):
-            demographic = self.demographics[i]
+        specialised = params.specialised_demographics()
+
+        # demographics often share the same adjustment, so cache the
+        # adjusted parameters rather than recreating them for each one
+        adjusted = {}
+
+        for demographic, subnet in zip(self.demographics, self.subnets):
             p = p.start(f"{demographic.name}.update")
-            if demographic.name in params.specialised_demographics():
+            if demographic.name in specialised:
                 subnet_params = params[demographic.name]
             else:
                 subnet_params = params
 
             if demographic.adjustment:
-                subnet_params = subnet_params.set_variables(
-                    demographic.adjustment)
+                key = (id(subnet_params), str(demographic.adjustment))
+
+                if key not in adjusted:
+                    adjusted[key] = subnet_params.set_variables(
+                        demographic.adjustment)
 
-            self.subnets[i].update(subnet_params, profiler=p)
+                subnet_params = adjusted[key]
+
+            subnet.update(subnet_params, profiler=p)
             p = p.stop()
 
     def initialise_infections(self, nthreads: int = 1):
@@ -422,11 +500,25 @@ class Networks:
     def rescale_play_matrix(self, nthreads: int = 1, profiler=None):
         """Rescale the play matrix"""
         if self.overall:
-            self.overall.reset_everything(nthreads=nthreads, profiler=profiler)
+            self.overall.rescale_play_matrix(nthreads=nthreads,
+                                             profiler=profiler)
 
         for subnet in self.subnets:
             subnet.rescale_play_matrix(nthreads=nthreads, profiler=profiler)
 
+    def reset_and_rescale(self, nthreads: int = 1, profiler=None):
+        """Reset the networks and then rescale the play matrices. This
+           is equivalent to calling reset_everything followed by
+           rescale_play_matrix, but finishes with each network before
+           moving onto the next
+        """
+        if self.overall:
+            self.overall.reset_and_rescale(nthreads=nthreads,
+                                           profiler=profiler)
+
+        for subnet in self.subnets:
+            subnet.reset_and_rescale(nthreads=nthreads, profiler=profiler)
+
     def move_from_play_to_work(self, nthreads: int = 1, profiler=None):
         """Move the population from play to work"""
         if self.overall:
@@ -436,3 +528,37 @@ class Networks:
         for subnet in self.subnets:
             subnet.move_from_play_to_work(nthreads=nthreads,
                                           profiler=profiler)
+
+    def run_function(self, func, infections, population, workspace,
+                     call_on_overall: bool = False,
+                     subnet_threads: int = 1, **kwargs):
+        """Call 'func' on all of the demographic subnetworks, passing
+           in the matching sub-infections, sub-population and
+           sub-workspace, plus any other arguments. The function is
+           then called on the overall network if 'call_on_overall'
+           is True. The subnetworks are processed at the same time
+           by a pool of 'subnet_threads' threads if this is greater
+           than 1. This is called by call_function_on_network
+        """
+        if subnet_threads > 1 and len(self.subnets) > 1:
+            pool = _get_thread_pool(subnet_threads)
+
+            futures = [pool.submit(func, network=subnet,
+                                   infections=infections.subinfs[i],
+                                   population=population.subpops[i],
+                                   workspace=workspace.subspaces[i],
+                                   **kwargs)
+                       for i, subnet in enumerate(self.subnets)]
+
+            # this will re-raise any exception raised by 'func'
+            for future in futures:
+                future.result()
+        else:
+            for i, subnet in enumerate(self.subnets):
+                func(network=subnet, infections=infections.subinfs[i],
+                     population=population.subpops[i],
+                     workspace=workspace.subspaces[i], **kwargs)
+
+        if call_on_overall:
+            func(network=self.overall, infections=infections,
+                 population=population, workspace=workspace, **kwargs)
@@ -1,4 +1,6 @@
 
+import json as _json
+import sys as _sys
 from dataclasses import dataclass as _dataclass
 from dataclasses import field as _field
 from typing import List as _List, Dict as _Dict
@@ -13,6 +15,29 @@ __all__ = ["Parameters", "get_repository_version", "get_repository"]
 
 _default_folder_name = "parameters"
 
+#: The fields of Parameters that are read from a parameters json file,
+#: together with the json key and the default used if this is missing
+_json_fields = (("length_day", "length_day", 0.7),
+                ("initial_inf", "initial_inf", 0),
+                ("static_play_at_home", "static_play_at_home", 0.0),
+                ("dyn_play_at_home", "dyn_play_at_home", 0.0),
+                ("dyn_dist_cutoff", "dyn_dist_cutoff", 10000000.0),
+                ("play_to_work", "play_to_work", 0.0),
+                ("work_to_play", "work_to_play", 0.0),
+                ("daily_imports", "daily_imports", 0),
+                ("UV", "UV", 0.0),
+                ("UV_max", "UV_max", None),
+                ("scale_uv", "scale_uv", 1.0),
+                ("bg_foi", "bg_foi", 0.0),
+                ("_authors", "author(s)", "unknown"),
+                ("_version", "version", "unknown"),
+                ("_contacts", "contact(s)", "unknown"),
+                ("_references", "reference(s)", "none"))
+
+# use __slots__ for faster attribute access and smaller objects
+# on Python versions where dataclass supports creating them
+_dataclass_args = {"slots": True} if _sys.version_info >= (3, 10) else {}
+
 
 _repositories = {}
 
@@ -92,8 +117,7 @@ def get_repository_version(repository: str):
 
     try:
         with open(filename) as FILE:
-            import json
-            version = json.load(FILE)
+            version = _json.load(FILE)
             _repositories[repository] = version
             return version
     except Exception:
@@ -105,8 +129,7 @@ def get_repository_version(repository: str):
         generate_repository_version(repository)
 
         with open(filename) as FILE:
-            import json
-            version = json.load(FILE)
+            version = _json.load(FILE)
             version["filepath"] = repository
             _repositories[repository] = version
             return version
@@ -124,7 +147,7 @@ info.""")
         return _repositories[repository]
 
 
-@_dataclass
+@_dataclass(**_dataclass_args)
 class Parameters:
     """The full set of Parameters that are used to control the model
        outbreak over a Network. The combination of a Network and
@@ -212,7 +235,8 @@ class Parameters:
 
     #: The parameters for demographic sub-networks. If this is None then
     #: the parameters are the same as the overall parameters
-    _subparams = None
+    _subparams: _Dict[str, "Parameters"] = _field(default=None, repr=False,
+                                                  compare=False)
 
     def __str__(self):
         parts = []
@@ -331,9 +355,9 @@ class Parameters:
         json_file = filename
 
         try:
-            with open(json_file, "r") as FILE:
-                import json
-                data = json.load(FILE)
+            from .utils._read_json import read_json_file
+            # the data is only read, so there is no need to copy it
+            data = read_json_file(json_file, copy=False)
 
         except Exception as e:
             from .utils._console import Console
@@ -345,33 +369,61 @@ set the model data.""")
             raise FileNotFoundError(f"Could not find or read {json_file}: "
                                     f"{e.__class__} {e}")
 
+        args = {field: data.get(key, default)
+                for (field, key, default) in _json_fields}
+
         par = Parameters(
-            length_day=data.get("length_day", 0.7),
-            initial_inf=data.get("initial_inf", 0),
-            static_play_at_home=data.get("static_play_at_home", 0.0),
-            dyn_play_at_home=data.get("dyn_play_at_home", 0.0),
-            dyn_dist_cutoff=data.get("dyn_dist_cutoff", 10000000.0),
-            play_to_work=data.get("play_to_work", 0.0),
-            work_to_play=data.get("work_to_play", 0.0),
-            daily_imports=data.get("daily_imports", 0),
-            UV=data.get("UV", 0.0),
-            UV_max=data.get("UV_max", None),
-            scale_uv=data.get("scale_uv", 1.0),
-            bg_foi=data.get("bg_foi", 0.0),
             _name=data.get("name", parameters),
-            _authors=data.get("author(s)", "unknown"),
-            _version=data.get("version", "unknown"),
-            _contacts=data.get("contact(s)", "unknown"),
-            _references=data.get("reference(s)", "none"),
             _filename=json_file,
             _repository=repository,
             _repository_dir=repository_dir,
             _repository_branch=repository_branch,
-            _repository_version=repository_version
+            _repository_version=repository_version,
+            **args
         )
 
         return par
 
+    @staticmethod
+    def load_many(filenames: _List[str], nthreads: int = None):
+        """Load and return the Parameters from each of the passed
+           json files. This is quicker than calling Parameters.load
+           for each file in turn when there are many files (e.g. at
+           the start of a parameter sweep), as the files are
+           read in parallel
+
+           Parameters
+           ----------
+           filenames: List[str]
+             The names of the files to load the parameters from. These
+             are loaded directly, as for the 'filename' argument
+             of Parameters.load
+           nthreads: int
+             The number of threads to use to read the files. If this
+             is None then a suitable number is chosen automatically
+
+           Returns
+           -------
+           params: List[Parameters]
+             The loaded parameters, in the same order as 'filenames'
+        """
+        filenames = list(filenames)
+
+        if nthreads is None:
+            nthreads = min(32, len(filenames))
+
+        if nthreads <= 1 or len(filenames) <= 1:
+            return [Parameters.load(filename=filename)
+                    for filename in filenames]
+
+        # reading the files is dominated by waiting for I/O, during
+        # which the GIL is released, so threads overlap the reads
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=nthreads) as pool:
+            return list(pool.map(lambda f: Parameters.load(filename=f),
+                                 filenames))
+
     def __getitem__(self, demographic: str):
         """Return the parameters that should be used for the demographic
            subnetwork called 'demographic'. If these have not been set
@@ -450,8 +502,7 @@ set the model data.""")
              based on that string.
         """
         if isinstance(input_files, InputFiles):
-            from copy import deepcopy
-            self.input_files = deepcopy(input_files)
+            self.input_files = input_files.copy()
             return
 
         self.input_files = InputFiles.load(input_files,
@@ -473,8 +524,7 @@ set the model data.""")
             from .utils._console import Console
             Console.print(disease, markdown=True)
 
-        from copy import deepcopy
-        self.disease_params = deepcopy(disease)
+        self.disease_params = disease.copy()
 
     def set_variables(self, variables: VariableSet):
         """This function sets the adjustable variable values to those
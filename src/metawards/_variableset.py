@@ -4,6 +4,7 @@ from typing import Dict as _Dict
 from typing import Union as _Union
 
 from datetime import date as _date
+from itertools import chain as _chain
 
 __all__ = ["VariableSets", "VariableSet"]
 
@@ -1336,7 +1337,8 @@ class VariableSets:
 
         # parse all lines using the csv module
         import csv
-        lines = open(filename, "r").readlines()
+        with open(filename, "r") as FILE:
+            lines = FILE.readlines()
 
         csvlines = []
         for line in lines:
@@ -1345,7 +1347,9 @@ class VariableSets:
             if len(line) > 0 and (not line.startswith("#")):
                 csvlines.append(line)
 
-        lines = []
+        if len(csvlines) == 0:
+            # there is nothing to read?
+            return VariableSets()
 
         # first try to guess the dialect of the file (space or comma
         # separated, newline character etc.)
@@ -1362,11 +1366,37 @@ class VariableSets:
                     f"wrong, then could you add commas to separate the "
                     f"fields?")
 
-            dialect = csv.excel  #  default comma-separated file
+            dialect = csv.excel  #  default comma-separated file
+
+        # the lines are cleaned lazily, so that only the lines that
+        # are needed are processed when reading specific line numbers
+        lines = VariableSets._clean_lines(
+            csv.reader(csvlines, dialect=dialect,
+                       quoting=csv.QUOTE_ALL,
+                       skipinitialspace=True))
+
+        first = next(lines, None)
+
+        if first is None:
+            # there is nothing to read?
+            return VariableSets()
 
-        for line in csv.reader(csvlines, dialect=dialect,
-                               quoting=csv.QUOTE_ALL,
-                               skipinitialspace=True):
+        if len(first) > 1 and first[1] == "==":
+            # this is a vertical file
+            if line_numbers is not None:
+                raise ValueError(
+                    "You cannot specify line numbers for a vertical file!")
+            return VariableSets._read_vertical(_chain([first], lines))
+        else:
+            return VariableSets._read_horizontal(
+                lines=_chain([first], lines), line_numbers=line_numbers)
+
+    @staticmethod
+    def _clean_lines(reader):
+        """Clean and yield each of the lines read by the passed
+           csv reader, skipping any empty lines
+        """
+        for line in reader:
             cleaned = [_clean(x) for x in line]
 
             line = []
@@ -1380,21 +1410,7 @@ class VariableSets:
                     else:
                         line.append(clean)
 
-                lines.append(line)
-
-        if len(lines) == 0:
-            # there is nothing to read?
-            return VariableSets()
-
-        if len(lines[0]) > 1 and len(lines[0]) > 1 and lines[0][1] == "==":
-            # this is a vertical file
-            if line_numbers is not None:
-                raise ValueError(
-                    "You cannot specify line numbers for a vertical file!")
-            return VariableSets._read_vertical(lines)
-        else:
-            return VariableSets._read_horizontal(lines=lines,
-                                                 line_numbers=line_numbers)
+                yield line
 
     @staticmethod
     def _read_vertical(lines):
@@ -1428,10 +1444,13 @@ class VariableSets:
         """Read the data from the horizontal lines"""
         variables = VariableSets()
 
+        lines = iter(lines)
+        first = next(lines)
+
         # are there any strings on the first line? If so, then these
         # are the titles
         has_titles = False
-        for v in lines[0]:
+        for v in first:
             try:
                 float(v)
             except Exception:
@@ -1439,9 +1458,11 @@ class VariableSets:
                 break
 
         if has_titles:
-            titles = lines[0]
-            lines = lines[1:]
+            titles = first
         else:
+            # the first line is data, so needs to be read
+            lines = _chain([first], lines)
+
             # default adjustable variables
             titles = ["beta[2]", "beta[3]", "progress[1]",
                       "progress[2]", "progress[3]"]
@@ -1454,8 +1475,14 @@ class VariableSets:
 
         repeats = []
 
+        if line_numbers is not None:
+            # a set is much quicker to search for large files
+            wanted = set(line_numbers)
+
+        i = -1
+
         for i, line in enumerate(lines):
-            if line_numbers is None or i in line_numbers:
+            if line_numbers is None or i in wanted:
                 values = [_interpret(x) for x in line]
 
                 if repeats_index is not None:
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+from array import array as _array
+from copy import deepcopy as _deepcopy
+from math import floor as _floor
+from math import fsum as _fsum
+from math import isnan as _isnan
+from operator import attrgetter as _attrgetter
+
 from ._wardinfo import WardInfo
 
+from typing import List as _List
 from typing import Union as _Union
 from typing import TYPE_CHECKING
 
@@ -12,6 +20,10 @@ __all__ = ["Ward"]
 
 
 def _as_positive_integer(number: int, zero_allowed: bool = True):
+    if number.__class__ is int and number >= (0 if zero_allowed else 1):
+        # fast path for the common case of an already-valid integer
+        return number
+
     try:
         number = int(number)
     except Exception:
@@ -27,6 +39,10 @@ def _as_positive_integer(number: int, zero_allowed: bool = True):
 
 
 def _as_positive_float(number: float):
+    if number.__class__ is float and number >= 0:
+        # fast path for the common case of an already-valid float
+        return number
+
     try:
         number = float(number)
     except Exception:
@@ -42,6 +58,12 @@ class Ward:
     """This class holds all of the information about a Ward. It is used
        to create and edit Networks
     """
+    # many Ward objects are created for a large network, so use slots
+    # to reduce their memory use and speed up attribute access. These
+    # are ordered so that the cheapest to compare are compared first
+    __slots__ = ("_id", "_num_workers", "_num_players", "_player_total",
+                 "_scale_uv", "_cutoff", "_bg_foi", "_auto_assign_players",
+                 "_info", "_pos", "_custom_params", "_workers", "_players")
 
     def __init__(self, id: int = None, name: str = None, code: str = None,
                  authority: str = None, region: str = None,
@@ -91,8 +113,7 @@ class Ward:
             if not isinstance(info, WardInfo):
                 raise TypeError(
                     f"The passed WardInfo {info} must be of type WardInfo")
-            from copy import deepcopy
-            self._info = deepcopy(info)
+            self._info = info.copy()
         else:
             self._info = WardInfo()
 
@@ -149,11 +170,29 @@ class Ward:
                 f"num_players={self.num_players()} )"
 
     def __repr__(self):
-        return self.__str__()
+        if self._id is None:
+            # wards without an ID can only be identified by their info
+            return self.__str__()
+
+        # keep this cheap, as it is used when printing large lists of wards
+        return f"Ward(id={self._id})"
 
     def __eq__(self, other):
-        return self.__class__ == other.__class__ and \
-            self.__dict__ == other.__dict__
+        if self.__class__ != other.__class__:
+            return False
+
+        try:
+            # the tuple comparison stops at the first difference
+            return _get_slots(self) == _get_slots(other)
+        except AttributeError:
+            # a null ward does not set all of the attributes
+            pass
+
+        for key in Ward.__slots__:
+            if getattr(self, key, None) != getattr(other, key, None):
+                return False
+
+        return True
 
     def __add__(self, other):
         if isinstance(other, Ward):
@@ -227,7 +266,7 @@ class Ward:
         for key, value in other._players.items():
             self._players[key] = self._players.get(key, 0.0) + (0.5 * value)
 
-        self._player_total = 1.0 - sum(self._players.values())
+        self._player_total = 1.0 - _fsum(self._players.values())
 
         assert self._player_total >= 0.0
 
@@ -264,8 +303,7 @@ class Ward:
         """Return (a copy of) the WardInfo containing all ward
            identifying metadata
         """
-        from copy import deepcopy
-        return deepcopy(self._info)
+        return self._info.copy()
 
     def scale_uv(self) -> float:
         """Return the scale_uv parameter for this ward. This is the amount
@@ -301,7 +339,9 @@ class Ward:
 
     def assert_sane(self):
         """Assert that the data in this ward is sane"""
-        t = sum(self._players.values()) + self._player_total
+        # use fsum so that rounding errors from summing many small
+        # weights don't trigger a false error
+        t = _fsum([self._player_total, *self._players.values()])
 
         if abs(t - 1.0) > 1e-6:
             raise AssertionError(f"Player sum should equal 1.0, not {t}")
@@ -348,28 +388,20 @@ class Ward:
 
         self._id = id
 
+        # move any links to this ward (keyed by either the old ID or,
+        # if unresolved, by this ward's info) so they use the new ID
         if old_id is not None:
-            for key in list(self._workers.keys()):
-                if key == old_id:
-                    self._workers[id] = self._workers[old_id]
-                    del self._workers[old_id]
-
-            for key in list(self._players.keys()):
-                if key == old_id:
-                    self._players[id] = self._players[old_id]
-                    del self._players[old_id]
-
-        if id not in self._workers:
-            for key in list(self._workers.keys()):
-                if key == self._info:
-                    self._workers[id] = self._workers[self._info]
-                    del self._workers[self._info]
-
-        if id not in self._players:
-            for key in list(self._players.keys()):
-                if key == self._info:
-                    self._players[id] = self._players[self._info]
-                    del self._players[self._info]
+            if old_id in self._workers:
+                self._workers[id] = self._workers.pop(old_id)
+
+            if old_id in self._players:
+                self._players[id] = self._players.pop(old_id)
+
+        if id not in self._workers and self._info in self._workers:
+            self._workers[id] = self._workers.pop(self._info)
+
+        if id not in self._players and self._info in self._players:
+            self._players[id] = self._players.pop(self._info)
 
     def set_code(self, code: str):
         """Set the code of this ward"""
@@ -421,9 +453,7 @@ class Ward:
         """
         bg_foi = float(bg_foi)
 
-        from math import isnan
-
-        if isnan(bg_foi):
+        if _isnan(bg_foi):
             raise ValueError("You cannot set bg_foi to NaN")
 
         self._bg_foi = bg_foi
@@ -440,13 +470,16 @@ class Ward:
         if not isinstance(info, WardInfo):
             raise TypeError(f"The ward info {info} must be a WardInfo object")
 
-        from copy import deepcopy
-        self._info = deepcopy(info)
+        self._info = info.copy()
 
     def _resolve_destination(self, destination: _Union[int, WardInfo] = None):
         """Resolve the passed destination into either an ID or a
            WardInfo object
         """
+        if destination.__class__ is int and destination > 0:
+            # fast path for the common case of passing a valid ID
+            return destination
+
         if destination is None:
             if self._id is None:
                 if self._info.is_null():
@@ -457,20 +490,23 @@ class Ward:
                 destination = self._id
 
         elif isinstance(destination, Ward):
-            if destination.id() is None:
+            if destination._id is None:
                 destination = destination._info
 
-                if self._id is not None and destination == self._info:
+                if self._id is not None and (destination is self._info or
+                                             destination == self._info):
                     # this is this ward
                     destination = self._id
             else:
-                if destination.id() == self._id:
-                    if self._info != destination._info:
+                if destination._id == self._id:
+                    # only compare the infos if they are different objects
+                    if destination._info is not self._info and \
+                            self._info != destination._info:
                         raise ValueError(
                             f"Disagreement in info for Ward {self}: "
                             f"{self._info} versus {destination._info}.")
 
-                destination = destination.id()
+                destination = destination._id
 
         if not isinstance(destination, WardInfo):
             destination = _as_positive_integer(destination, zero_allowed=False)
@@ -510,8 +546,7 @@ class Ward:
         if _inplace:
             ward = self
         else:
-            from copy import deepcopy
-            ward = deepcopy(self)
+            ward = _deepcopy(self)
 
         ward._id = None
         ward._workers = workers
@@ -552,8 +587,7 @@ class Ward:
         if _inplace:
             ward = self
         else:
-            from copy import deepcopy
-            ward = deepcopy(self)
+            ward = _deepcopy(self)
 
         if ward._info is not None and ward._info in wards:
             idx = wards.index(ward._info)
@@ -575,15 +609,10 @@ class Ward:
         if self._id is None:
             return False
 
-        for key in self._workers.keys():
-            if not isinstance(key, int):
-                return False
-
-        for key in self._players.keys():
-            if not isinstance(key, int):
-                return False
-
-        return True
+        # resolved links are keyed by (exact) int IDs, while unresolved
+        # links are keyed by WardInfo objects
+        return all(key.__class__ is int for key in self._workers) and \
+            all(key.__class__ is int for key in self._players)
 
     def depopulate(self, zero_player_weights: bool = False) -> Ward:
         """Return a copy of this Ward with exact same details, but with
@@ -591,8 +620,7 @@ class Ward:
            this will also zero the player weights for all connected
            wards
         """
-        from copy import deepcopy
-        result = deepcopy(self)
+        result = _deepcopy(self)
 
         result._num_workers = 0
         result._num_players = 0
@@ -654,27 +682,30 @@ class Ward:
         destination = self._resolve_destination(destination)
         number = _as_positive_integer(number)
 
-        if destination not in self._workers:
-            self._workers[destination] = 0
-
-        self._workers[destination] += number
+        workers = self._workers
+        workers[destination] = workers.get(destination, 0) + number
         self._num_workers += number
 
     def subtract_workers(self, number: int, destination: int = None):
         """Remove some workers from this ward, specifying their destination
-           if they work out of ward
+           if they work out of ward. The link to the destination is
+           removed if this would leave zero (or fewer) workers
         """
         destination = self._resolve_destination(destination)
         number = _as_positive_integer(number)
 
-        if destination not in self._workers:
+        workers = self._workers
+
+        if destination not in workers:
             return
 
-        if number >= self._workers[destination]:
-            self._num_workers -= self._workers[destination]
-            del self._workers[destination]
+        current = workers[destination]
+
+        if number >= current:
+            del workers[destination]
+            self._num_workers -= current
         else:
-            self._workers -= number
+            workers[destination] = current - number
             self._num_workers -= number
 
     def add_player_weight(self, weight: float, destination: int = None):
@@ -701,10 +732,8 @@ class Ward:
                 f"than the remaining weight available {self._player_total}. "
                 f"You can only add a weight that is less than this value")
 
-        if destination not in self._players:
-            self._players[destination] = 0
-
-        self._players[destination] += weight
+        players = self._players
+        players[destination] = players.get(destination, 0.0) + weight
         self._player_total -= weight
 
         if self._player_total < tiny:
@@ -740,7 +769,11 @@ class Ward:
            destination ward (or who commute to their home ward if
            destination is not set)
         """
-        destination = self._resolve_destination(destination)
+        if destination is None and self._id is not None:
+            destination = self._id
+        else:
+            destination = self._resolve_destination(destination)
+
         return self._workers.get(destination, 0)
 
     def get_players(self, destination: int = None):
@@ -748,7 +781,10 @@ class Ward:
            specified destination ward (or who play in their home
            ward if destination is not set)
         """
-        destination = self._resolve_destination(destination)
+        if destination is None and self._id is not None:
+            destination = self._id
+        else:
+            destination = self._resolve_destination(destination)
 
         p = self._players.get(destination, 0.0)
 
@@ -757,6 +793,29 @@ class Ward:
 
         return p
 
+    def get_players_batch(self, destinations: _List[int]) -> _List[float]:
+        """Return the fractions of players who will play in each of
+           the specified destination wards. This is equivalent to,
+           but quicker than, calling get_players for each destination
+        """
+        resolve = self._resolve_destination
+        players = self._players
+        home = self._id if self._auto_assign_players else None
+        player_total = self._player_total
+
+        weights = []
+
+        for destination in destinations:
+            destination = resolve(destination)
+            p = players.get(destination, 0.0)
+
+            if home is not None and destination == home:
+                p += player_total
+
+            weights.append(p)
+
+        return weights
+
     def num_work_links(self):
         """Return the total number of work links"""
         return len(self._workers)
@@ -804,29 +863,56 @@ class Ward:
                     f"Cannot set the number of workers to {number} as there "
                     f"are not enough home workers to subtract")
 
-    def get_worker_lists(self):
-        """Return a pair of arrays, containing the destination wards
-           and worker populations for this ward
+    def _sorted_worker_items(self):
+        """Return a pair of lists, containing the destination wards
+           and worker populations for this ward, sorted by destination
         """
-        from .utils._array import create_int_array
-
-        keys = list(self._workers.keys())
+        for key in self._workers:
+            if not isinstance(key, int):
+                raise KeyError(
+                    f"Cannot create worker list as link to {key} is "
+                    f"unresolved")
 
-        keys.sort()
+        items = sorted(self._workers.items())
 
-        wards = create_int_array(len(keys))
-        pops = create_int_array(len(keys))
+        return ([key for key, _ in items], [value for _, value in items])
 
-        for i, key in enumerate(keys):
+    def _sorted_player_items(self, no_auto_assign: bool = False):
+        """Return a pair of lists, containing the destination wards
+           and player weights for this ward, sorted by destination.
+           See get_player_lists for the meaning of 'no_auto_assign'
+        """
+        for key in self._players:
             if not isinstance(key, int):
                 raise KeyError(
                     f"Cannot create worker list as link to {key} is "
                     f"unresolved")
 
-            wards[i] = key
-            pops[i] = self._workers[key]
+        players = self._players
+
+        if self._auto_assign_players and not no_auto_assign:
+            if not isinstance(self._id, int):
+                raise KeyError(
+                    f"Cannot create worker list as link to {self._id} is "
+                    f"unresolved")
+
+            players = dict(players)
+            players[self._id] = players.get(self._id, 0.0) + \
+                self._player_total
+
+        items = sorted(players.items())
 
-        return (wards, pops)
+        return ([key for key, _ in items], [value for _, value in items])
+
+    def get_worker_lists(self):
+        """Return a pair of arrays, containing the destination wards
+           and worker populations for this ward
+        """
+        wards, pops = self._sorted_worker_items()
+
+        # fill the arrays directly from the lists, rather than
+        # assigning each value in turn
+        return (_array("i", wards), _array("i", pops))
 
     def get_player_lists(self, no_auto_assign: bool = False):
         """Return a pair of arrays, containing the destination wards
@@ -836,33 +922,10 @@ class Ward:
            auto-assigned weights. This normally should be false,
            as it is only used when serialising
         """
-        from .utils._array import create_double_array, create_int_array
-
-        keys = list(self._players.keys())
-
-        auto_assign = (not no_auto_assign) and self._auto_assign_players
-
-        if auto_assign and self._id not in keys:
-            keys.append(self._id)
-
-        keys.sort()
-
-        wards = create_int_array(len(keys))
-        weights = create_double_array(len(keys))
-
-        for i, key in enumerate(keys):
-            if not isinstance(key, int):
-                raise KeyError(
-                    f"Cannot create worker list as link to {key} is "
-                    f"unresolved")
-
-            wards[i] = key
-            weights[i] = self._players.get(key, 0.0)
-
-            if auto_assign and key == self._id:
-                weights[i] += self._player_total
+        wards, weights = self._sorted_player_items(
+            no_auto_assign=no_auto_assign)
 
-        return (wards, weights)
+        return (_array("i", wards), _array("d", weights))
 
     def set_position(self, x: float = None, y: float = None,
                      lat: float = None, long: float = None,
@@ -930,8 +993,11 @@ class Ward:
            {"lat", "long"} coordinates, or an empty dictionary
            if cooordinates have not been set.
         """
-        from copy import deepcopy
-        return deepcopy(self._pos)
+        if not self._pos:
+            return {}
+
+        # the position only holds floats, so a shallow copy is enough
+        return dict(self._pos)
 
     def work_connections(self):
         """Return the full list of work connections for this ward"""
@@ -979,20 +1045,17 @@ class Ward:
         if _inplace:
             ward = self
         else:
-            from copy import deepcopy
-            ward = deepcopy(self)
+            ward = _deepcopy(self)
 
         def scale_and_round(value, scale):
-            import math
-
             if scale > 0.5:
                 # round up for large scales, as smaller scales will always
                 # round down
-                return int(math.floor((value * scale) + 0.5))
+                return int(_floor((value * scale) + 0.5))
             else:
                 # rounding down - hopefully this will minimise the number
                 # of values that need to be redistributed
-                return int(math.floor(value * scale))
+                return int(_floor(value * scale))
 
         if play_ratio != 1.0:
             ward._num_players = scale_and_round(ward._num_players, play_ratio)
@@ -1022,17 +1085,19 @@ class Ward:
         data["num_workers"] = self.num_workers()
         data["num_players"] = self.num_players()
 
-        workers = self.get_worker_lists()
+        # use the sorted lists directly, rather than converting to
+        # and then back from arrays
+        wards, pops = self._sorted_worker_items()
 
-        if len(workers[0]) > 0:
-            data["workers"] = {"destination": workers[0].tolist(),
-                               "population": workers[1].tolist()}
+        if len(wards) > 0:
+            data["workers"] = {"destination": wards,
+                               "population": pops}
 
-        players = self.get_player_lists(no_auto_assign=True)
+        wards, weights = self._sorted_player_items(no_auto_assign=True)
 
-        if len(players[0]) > 0:
-            data["players"] = {"destination": players[0].tolist(),
-                               "weights": players[1].tolist()}
+        if len(wards) > 0:
+            data["players"] = {"destination": wards,
+                               "weights": weights}
 
         if self._scale_uv != 1.0:
             data["scale_uv"] = self._scale_uv
@@ -1044,8 +1109,7 @@ class Ward:
             data["bg_foi"] = self._bg_foi
 
         if len(self._custom_params) > 0:
-            from copy import deepcopy
-            data["custom"] = deepcopy(self._custom_params)
+            data["custom"] = _deepcopy(self._custom_params)
 
         return data
 
@@ -1074,14 +1138,22 @@ class Ward:
 
         workers = data.get("workers", {})
 
-        for d, p in zip(workers.get("destination", []),
-                        workers.get("population", [])):
-            d = _as_positive_integer(d, zero_allowed=False)
-            p = _as_positive_integer(p)
+        # validate the destinations and populations as whole lists, and
+        # then build the dictionary in one go
+        dests = [_as_positive_integer(d, zero_allowed=False)
+                 for d in workers.get("destination", [])]
+        pops = [_as_positive_integer(p)
+                for p in workers.get("population", [])]
 
-            ward._workers[d] = p
+        ward._workers = dict(zip(dests, pops))
 
-        ward._num_workers = sum(ward._workers.values())
+        # keep the running total of workers from the populations as
+        # read, which is only valid if no destination was repeated
+        # (a repeated destination replaces the earlier value)
+        if len(dests) == len(pops) == len(ward._workers):
+            ward._num_workers = sum(pops)
+        else:
+            ward._num_workers = sum(ward._workers.values())
 
         if data.get("num_workers", 0) > 0:
             if ward.num_workers() != data["num_workers"]:
@@ -1091,14 +1163,14 @@ class Ward:
 
         players = data.get("players", {})
 
-        for d, w in zip(players.get("destination", []),
-                        players.get("weights", [])):
-            d = _as_positive_integer(d, zero_allowed=False)
-            w = _as_positive_float(w)
+        dests = [_as_positive_integer(d, zero_allowed=False)
+                 for d in players.get("destination", [])]
+        weights = [_as_positive_float(w)
+                   for w in players.get("weights", [])]
 
-            ward._players[d] = w
+        ward._players = dict(zip(dests, weights))
 
-        ward._player_total = 1.0 - sum(ward._players.values())
+        ward._player_total = 1.0 - _fsum(ward._players.values())
 
         if abs(ward._player_total) < 1e-10:
             ward._player_total = 0
@@ -1211,3 +1283,7 @@ class Ward:
             raise IOError(f"Cannot load Wards from '{s}'")
 
         return Ward.from_data(data)
+
+
+# return all of a Ward's attributes as a tuple (used for comparisons)
+_get_slots = _attrgetter(*Ward.__slots__)
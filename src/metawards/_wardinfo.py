@@ -1,4 +1,5 @@
 
+import sys as _sys
 from dataclasses import dataclass as _dataclass
 from dataclasses import field as _field
 from typing import List as _List
@@ -6,8 +7,12 @@ from typing import Dict as _Dict
 
 __all__ = ["WardInfo", "WardInfos"]
 
+# use __slots__ for faster attribute access and smaller objects
+# on Python versions where dataclass supports creating them
+_dataclass_args = {"slots": True} if _sys.version_info >= (3, 10) else {}
 
-@_dataclass
+
+@_dataclass(**_dataclass_args)
 class WardInfo:
     """This class holds metadata about a ward, e.g. its name(s),
        any ID code(s), any information about the region or
@@ -38,9 +43,26 @@ class WardInfo:
     def __hash__(self):
         return f"{self.name} | {self.authority} | {self.region}".__hash__()
 
+    def __deepcopy__(self, memo):
+        return self.copy()
+
     def is_null(self):
         return self == WardInfo()
 
+    def copy(self):
+        """Return a copy of this WardInfo. This is much quicker than
+           a deepcopy, as only the lists of alternate names and codes
+           need to be copied (all other values are immutable strings)
+        """
+        return WardInfo(name=self.name,
+                        alternate_names=list(self.alternate_names),
+                        code=self.code,
+                        alternate_codes=list(self.alternate_codes),
+                        authority=self.authority,
+                        authority_code=self.authority_code,
+                        region=self.region,
+                        region_code=self.region_code)
+
     def summary(self):
         """Return a summary string that identifies this WardInfo"""
         s = []
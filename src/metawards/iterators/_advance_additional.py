@@ -1,15 +1,25 @@
 
 from typing import Union as _Union
+from weakref import finalize as _finalize
 
 from .._network import Network
 from .._networks import Networks
 from .._population import Population
 from ..utils._profiler import Profiler
 from .._infections import Infections
+from .._interpret import Interpret
+from ..utils._console import Console, Table
 
 __all__ = ["advance_additional"]
 
 
+# The additional seeds (grouped by day), plus the cache of seeded
+# work links, for each network that is being seeded. This is keyed
+# by the id of the network, and each entry is removed when its
+# network is garbage collected
+_seeds_cache = {}
+
+
 def _get_ward(s, network, rng):
     if s is None:
         return 1
@@ -18,8 +28,14 @@ def _get_ward(s, network, rng):
         raise TypeError("This should be a Network object...")
 
     try:
-        from .._interpret import Interpret
-        index = Interpret.integer(s, rng=rng, minval=1, maxval=network.nnodes)
+        if isinstance(s, str) and s.strip().isdigit():
+            # fast path for the common case of a plain integer, clamped
+            # to the valid range in the same way as Interpret.integer
+            index = min(max(int(s), 1), network.nnodes)
+        else:
+            index = Interpret.integer(s, rng=rng, minval=1,
+                                      maxval=network.nnodes)
+
         return network.get_node_index(index)
     except Exception:
         pass
@@ -38,6 +54,39 @@ def _get_demographic(s, network):
     return network.demographics.get_index(s)
 
 
+# translation table used to treat tabs as extra separators in
+# comma-separated additional seeds files
+_tabs_to_commas = str.maketrans("\t", ",")
+
+
+def _split_line(line: str, comma_separated: bool):
+    """Split the passed line of an additional seeds file into its
+       words, stopping at the first comment. Lines are split using
+       simple string splitting, unless they contain quoted fields,
+       when they are parsed using the csv module
+    """
+    # yes, the original files really do mix tabs and spaces... so
+    # tabs are always treated as separators too
+    if '"' in line:
+        import csv
+        fields = next(csv.reader([line],
+                                 delimiter="," if comma_separated else " ",
+                                 skipinitialspace=True))
+        words = [p.strip() for field in fields for p in field.split("\t")]
+    elif comma_separated:
+        words = [p.strip() for p in
+                 line.translate(_tabs_to_commas).split(",")]
+    else:
+        # this splits on both spaces and tabs
+        words = line.split()
+
+    for i, word in enumerate(words):
+        if word.startswith("#"):
+            return words[:i]
+
+    return words
+
+
 def _load_additional_seeds(network: _Union[Network, Networks],
                            filename: str, rng):
     """Load additional seeds from the passed filename. This returns
@@ -46,78 +95,49 @@ def _load_additional_seeds(network: _Union[Network, Networks],
        content, it is quicker to pass this than the filename
     """
     import os as _os
-    from ..utils._console import Console, Table
 
     if _os.path.exists(filename):
         Console.print(f"Loading additional seeds from {filename}")
-        with open(filename, "r") as FILE:
-            ilines = FILE.readlines()
+        # read and decode the whole file at once
+        with open(filename, "rb") as FILE:
+            ilines = FILE.read().decode("utf-8",
+                                        errors="replace").splitlines()
     else:
         Console.print(f"Loading additional seeds from the command line")
         ilines = filename.split("\\n")
 
-    lines = []
-
-    for line in ilines:
-        for l in line.split(";"):
-            lines.append(l.strip())
+    lines = [l.strip() for line in ilines for l in line.split(";")]
 
     seeds = []
 
-    table = Table()
-    table.add_column("Day")
-    table.add_column("Demographic")
-    table.add_column("Ward")
-    table.add_column("Number seeded")
-
-    import csv
+    # only build the table of seeds if it will be printed, as
+    # rendering the table is expensive for large seed files
+    if Console.is_enabled():
+        table = Table()
+        table.add_column("Day")
+        table.add_column("Demographic")
+        table.add_column("Ward")
+        table.add_column("Number seeded")
+    else:
+        table = None
 
-    # remove any initial comment lines (breaks sniffing below)
+    # remove any initial comment lines
     while lines[0].strip().startswith("#"):
         lines.pop(0)
 
-    # remove any empty initial lines (breaks sniffing below)
+    # remove any empty initial lines
     while len(lines[0].strip()) == 0:
         lines.pop(0)
 
-    try:
-        dialect = csv.Sniffer().sniff(lines[0], delimiters=[" ", ","])
-    except Exception:
-        words = lines[0].strip().split(" ")
-
-        if len(words) > 1:
-            Console.warning(
-                f"Could not identify what sort of separator to use to "
-                f"read the additional seeds, so will assume commas. If this "
-                f"is wrong then could you add commas to separate the "
-                f"fields?")
-
-        dialect = csv.excel  #  default comma-separated file
+    # the fields are either comma or space separated. This is
+    # identified from the first line
+    comma_separated = "," in lines[0]
 
     titles = None
     nwords = None
 
-    for line in csv.reader(lines, dialect=dialect,
-                           quoting=csv.QUOTE_ALL,
-                           skipinitialspace=True):
-
-        words = []
-
-        # yes, the original files really do mix tabe and spaces... need
-        # to extract these separately!
-        for l in line:
-            rest_commented = False
-
-            for p in l.split("\t"):
-                p = p.strip()
-                if p.startswith("#"):
-                    rest_commented = True
-                    break
-
-                words.append(p)
-
-            if rest_commented:
-                break
+    for line in lines:
+        words = _split_line(line, comma_separated=comma_separated)
 
         if len(words) == 0:
             continue
@@ -171,10 +191,6 @@ def _load_additional_seeds(network: _Union[Network, Networks],
                     titles = {"day": 0, "number": 1,
                               "ward": 2, "demographic": 3}
 
-        row = []
-
-        from .._interpret import Interpret
-
         # is in the file as "t loc num"
         day = titles.get("day", None)
 
@@ -183,8 +199,6 @@ def _load_additional_seeds(network: _Union[Network, Networks],
         else:
             day = 1
 
-        row.append(str(day))
-
         this_network = network
 
         demographic = titles.get("demographic", None)
@@ -203,8 +217,6 @@ def _load_additional_seeds(network: _Union[Network, Networks],
             # the first demographic
             this_network = network.subnets[0]
 
-        row.append(str(demographic))
-
         ward = titles.get("ward", None)
 
         if ward is not None:
@@ -212,11 +224,6 @@ def _load_additional_seeds(network: _Union[Network, Networks],
         else:
             ward = 1
 
-        try:
-            row.append(f"{ward} : {this_network.info[ward]}")
-        except Exception:
-            row.append(str(ward))
-
         seed = titles.get("number", None)
 
         if seed is not None:
@@ -224,12 +231,18 @@ def _load_additional_seeds(network: _Union[Network, Networks],
         else:
             seed = 0
 
-        row.append(str(seed))
-        table.add_row(row)
-
         seeds.append((day, ward, seed, demographic))
 
-    Console.print(table.to_string())
+        if table is not None:
+            try:
+                ward_name = f"{ward} : {this_network.info[ward]}"
+            except Exception:
+                ward_name = str(ward)
+
+            table.add_row([str(day), str(demographic), ward_name, str(seed)])
+
+    if table is not None:
+        Console.print(table.to_string())
 
     return seeds
 
@@ -270,6 +283,71 @@ def setup_additional_seeds(network: _Union[Network, Networks],
     return additional_seeds
 
 
+def _group_seeds_by_day(network: _Union[Network, Networks],
+                        additional_seeds):
+    """Group the passed additional seeds by the day (or date) on which
+       they should be seeded, so that each day only needs to look
+       up its own seeds. The demographic and ward indexes of each seed
+       are resolved here, once, rather than every time the seed is
+       applied. The index of each seed is kept so that seeds
+       can be applied in their original order
+    """
+    from collections import defaultdict
+    seeds_by_day = defaultdict(list)
+
+    is_networks = isinstance(network, Networks)
+
+    for i, seed in enumerate(additional_seeds):
+        try:
+            if is_networks:
+                demographic = seed[3]
+
+                if demographic is None:
+                    # not specified, so seed the first demographic
+                    demographic = 0
+                else:
+                    demographic = network.demographics.get_index(demographic)
+
+                seed_network = network.subnets[demographic]
+            else:
+                demographic = None
+                seed_network = network
+
+            ward = seed_network.get_node_index(seed[1])
+        except Exception as e:
+            Console.error(
+                f"Unable to seed the infection using {seed}. The "
+                f"error was {e.__class__}: {e}. Please double-check "
+                f"that you are trying to seed a node that exists "
+                f"in this network.")
+            raise e
+
+        seeds_by_day[seed[0]].append((i, seed, demographic, ward))
+
+    return dict(seeds_by_day)
+
+
+def _get_seed_link(network: Network, ward: int, links):
+    """Return the index of the link from 'ward' to itself in
+       'network', or None if there is no such link. Finding the
+       link means searching all of the links, so the result
+       is cached in 'links'
+    """
+    try:
+        return links[ward]
+    except KeyError:
+        pass
+
+    try:
+        link = network.links.get_index_of_link(ward, ward)
+    except Exception:
+        link = None
+
+    links[ward] = link
+
+    return link
+
+
 def advance_additional(network: _Union[Network, Networks],
                        population: Population,
                        infections: Infections,
@@ -296,98 +374,108 @@ def advance_additional(network: _Union[Network, Networks],
          Arguments that aren't used by this advancer
     """
 
-    if not hasattr(network, "_advance_additional_seeds"):
-        network._advance_additional_seeds = \
-            setup_additional_seeds(network=network, profiler=profiler,
-                                   rng=rngs[0])
+    try:
+        seeds_by_day, seed_links_cache = _seeds_cache[id(network)]
+    except KeyError:
+        seeds_by_day = _group_seeds_by_day(
+            network=network,
+            additional_seeds=setup_additional_seeds(network=network,
+                                                    profiler=profiler,
+                                                    rng=rngs[0]))
 
-    from ..utils._console import Console
+        # cache of the work link for each seeded (demographic, ward)
+        seed_links_cache = {}
 
-    additional_seeds = network._advance_additional_seeds
+        _seeds_cache[id(network)] = (seeds_by_day, seed_links_cache)
+        _finalize(network, _seeds_cache.pop, id(network), None)
 
-    p = profiler.start("additional_seeds")
-    for seed in additional_seeds:
-        if seed[0] == population.day or seed[0] == population.date:
-            ward = seed[1]
-            num = seed[2]
+    if len(seeds_by_day) == 0:
+        # there are no additional seeds to apply on any day
+        return
 
-            if isinstance(network, Networks):
-                demographic = seed[3]
+    # seeds can be specified either by day or by date
+    additional_seeds = seeds_by_day.get(population.day, [])
 
-                if demographic is None:
-                    # not specified, so seed the first demographic
-                    demographic = 0
-                else:
-                    demographic = network.demographics.get_index(demographic)
+    if population.date is not None and population.date in seeds_by_day:
+        additional_seeds = sorted(additional_seeds +
+                                  seeds_by_day[population.date])
+
+    if len(additional_seeds) == 0:
+        return
+
+    # the arrays for each demographic that is seeded today, so that
+    # these are only looked up once, however many seeds there are
+    targets = {}
+
+    p = profiler.start("additional_seeds")
+    for _, seed, demographic, ward in additional_seeds:
+        num = seed[2]
 
+        try:
+            (seed_network, play_suscept, seed_infections,
+             seed_work_infections) = targets[demographic]
+        except KeyError:
+            if demographic is not None:
                 seed_network = network.subnets[demographic]
-                seed_wards = seed_network.nodes
-                seed_links = seed_network.links
                 seed_infections = infections.subinfs[demographic].play
                 seed_work_infections = infections.subinfs[demographic].work
             else:
-                demographic = None
                 seed_network = network
-                seed_wards = seed_network.nodes
-                seed_links = seed_network.links
                 seed_infections = infections.play
                 seed_work_infections = infections.work
 
-            try:
-                ward = seed_network.get_node_index(ward)
+            play_suscept = seed_network.nodes.play_suscept
 
-                num_to_seed = min(num, seed_wards.play_suscept[ward])
+            targets[demographic] = (seed_network, play_suscept,
+                                    seed_infections, seed_work_infections)
 
-                if num_to_seed > 0:
-                    seed_wards.play_suscept[ward] -= num_to_seed
-                    if demographic is not None:
-                        Console.print(
-                            f"seeding demographic {demographic} "
-                            f"play_infections[0][{ward}] += {num_to_seed}")
-                    else:
-                        Console.print(f"seeding play_infections[0][{ward}] "
-                                      f"+= {num_to_seed}")
+        seed_links = seed_network.links
 
-                    seed_infections[0][ward] += num_to_seed
+        num_to_seed = int(min(num, play_suscept[ward]))
 
-                num -= num_to_seed
+        if num_to_seed > 0:
+            play_suscept[ward] -= num_to_seed
 
-                if num <= 0:
-                    continue
+            if demographic is not None and Console.is_enabled():
+                Console.print(
+                    f"seeding demographic {demographic} "
+                    f"play_infections[0][{ward}] += {num_to_seed}")
+            elif Console.is_enabled():
+                Console.print(f"seeding play_infections[0][{ward}] "
+                              f"+= {num_to_seed}")
 
-                try:
-                    link = seed_links.get_index_of_link(ward, ward)
-                except Exception:
-                    link = None
-
-                if link is not None:
-                    num_to_seed = int(min(num, seed_links.suscept[link]))
-
-                    if num_to_seed > 0:
-                        seed_links.suscept[link] -= num_to_seed
-                        if demographic is not None:
-                            Console.print(
-                                f"seeding demographic {demographic} "
-                                f"work_infections[0][{link}] += {num_to_seed}")
-                        else:
-                            Console.print(f"seeding work_infections[0][{link}]"
-                                          f" += {num_to_seed}")
-
-                        seed_work_infections[0][link] += num_to_seed
-
-                    num -= num_to_seed
-
-                if num > 0:
-                    Console.warning(
-                        f"Could not fully seed the ward {ward}. "
-                        f"Number remaining equals {num}.")
-
-            except Exception as e:
-                Console.error(
-                    f"Unable to seed the infection using {seed}. The "
-                    f"error was {e.__class__}: {e}. Please double-check "
-                    f"that you are trying to seed a node that exists "
-                    f"in this network.")
-                raise e
+            seed_infections[0][ward] += num_to_seed
+
+        num -= num_to_seed
+
+        if num <= 0:
+            continue
+
+        link = _get_seed_link(
+            seed_network, ward,
+            seed_links_cache.setdefault(demographic, {}))
+
+        if link is not None:
+            num_to_seed = int(min(num, seed_links.suscept[link]))
+
+            if num_to_seed > 0:
+                seed_links.suscept[link] -= num_to_seed
+
+                if demographic is not None and Console.is_enabled():
+                    Console.print(
+                        f"seeding demographic {demographic} "
+                        f"work_infections[0][{link}] += {num_to_seed}")
+                elif Console.is_enabled():
+                    Console.print(f"seeding work_infections[0][{link}]"
+                                  f" += {num_to_seed}")
+
+                seed_work_infections[0][link] += num_to_seed
+
+            num -= num_to_seed
+
+        if num > 0:
+            Console.warning(
+                f"Could not fully seed the ward {ward}. "
+                f"Number remaining equals {num}.")
 
     p.stop()
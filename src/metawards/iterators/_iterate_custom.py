@@ -1,4 +1,6 @@
 
+from functools import lru_cache as _lru_cache
+from functools import partial as _partial
 from typing import List as _List
 from typing import Union as _Union
 from ..utils._get_functions import MetaFunction, accepts_stage
@@ -7,6 +9,110 @@ __all__ = ["iterate_custom",
            "build_custom_iterator"]
 
 
+def _resolve_custom_iterator(custom_function: str,
+                             parent_name: str) -> MetaFunction:
+    """Find and return the function associated with the string
+       'custom_function'. See build_custom_iterator for the search order
+    """
+    # is it metawards.iterators.{custom_function}, or is this a
+    # function that is already in the current namespace, the
+    # __name__ namespace of the caller, or the __main__ namespace
+    # (e.g. if this was loaded in a script)
+    import sys
+
+    # there is no need to import metawards.iterators, as it has
+    # always been loaded by the time this function is called
+    for module_name in ["metawards.iterators", __name__, parent_name,
+                        "__main__"]:
+        func = getattr(sys.modules.get(module_name), custom_function, None)
+
+        if hasattr(func, "__call__"):
+            return func
+
+    return _import_custom_iterator(custom_function)
+
+
+@_lru_cache(maxsize=None)
+def _import_custom_iterator(custom_function: str) -> MetaFunction:
+    """Import and return the function associated with the string
+       'custom_function' from a module or file. This is cached, so
+       that the (slow) import and search of the module only happens
+       once for each name. Functions that are already in a namespace
+       are found by _resolve_custom_iterator before this is called,
+       so redefining those functions is picked up
+    """
+    from ..utils._console import Console
+
+    # can we import this function as a file - need to check that
+    # the user hasn't written this as module::function
+    if custom_function.find("::") != -1:
+        parts = custom_function.split("::")
+        func_name = parts[-1]
+        func_module = "::".join(parts[0:-1])
+    else:
+        func_name = None
+        func_module = custom_function
+
+    from ..utils._import_module import import_module
+    module = import_module(func_module)
+
+    if module is None:
+        # we cannot find the iterator
+        Console.error(
+            f"Cannot find the iterator '{custom_function}'."
+            f"Please make sure this is spelled correctly and "
+            f"any python modules/files needed are in the "
+            f"PYTHONPATH or current directory")
+        raise ImportError(f"Could not import the iterator "
+                          f"'{custom_function}'")
+
+    if func_name is None:
+        # find the last function that starts with 'iterate'
+        import inspect
+        funcs = []
+        for name, value in inspect.getmembers(module):
+            if name.startswith("iterate"):
+                if hasattr(value, "__call__"):
+                    if value.__module__ == module.__name__:
+                        # this is a function defined in this module
+                        funcs.append(value)
+
+        if len(funcs) > 0:
+            func = funcs[0]
+
+            if len(funcs) > 1:
+                Console.warning(
+                    f"Multiple possible matching functions: {funcs}. "
+                    f"Choosing {func}. Please use the module::function "
+                    f"syntax if this is the wrong choice.")
+        else:
+            func = None
+
+        if func is not None:
+            return func
+
+        Console.error(
+            f"Could not find any function in the module "
+            f"{custom_function} that has a name that starts "
+            f"with 'iterate'. Please manually specify the "
+            f"name using the '{custom_function}::your_function syntax")
+
+        raise ImportError(f"Could not import the iterator "
+                          f"{custom_function}")
+
+    else:
+        if hasattr(module, func_name):
+            return getattr(module, func_name)
+
+        Console.error(
+            f"Could not find the function {func_name} in the "
+            f"module {func_module}. Check that the spelling "
+            f"is correct and that the right version of the module "
+            f"is being loaded.")
+        raise ImportError(f"Could not import the iterator "
+                          f"{custom_function}")
+
+
 def build_custom_iterator(custom_function: _Union[str, MetaFunction],
                           parent_name="__main__") -> MetaFunction:
     """Build and return a custom iterator from the passed
@@ -42,108 +148,8 @@ def build_custom_iterator(custom_function: _Union[str, MetaFunction],
 
     if isinstance(custom_function, str):
         Console.print(f"Importing a custom iterator from {custom_function}")
-
-        # we need to find the function
-        import metawards.iterators
-
-        # is it metawards.iterators.{custom_function}
-        try:
-            func = getattr(metawards.iterators, custom_function)
-            return build_custom_iterator(func)
-        except Exception:
-            pass
-
-        # do we have the function in the current namespace?
-        import sys
-        try:
-            func = getattr(sys.modules[__name__], custom_function)
-            return build_custom_iterator(func)
-        except Exception:
-            pass
-
-        # how about the __name__ namespace of the caller
-        try:
-            func = getattr(sys.modules[parent_name], custom_function)
-            return build_custom_iterator(func)
-        except Exception:
-            pass
-
-        # how about the __main__ namespace (e.g. if this was loaded
-        # in a script)
-        try:
-            func = getattr(sys.modules["__main__"], custom_function)
-            return build_custom_iterator(func)
-        except Exception:
-            pass
-
-        # can we import this function as a file - need to check that
-        # the user hasn't written this as module::function
-        if custom_function.find("::") != -1:
-            parts = custom_function.split("::")
-            func_name = parts[-1]
-            func_module = "::".join(parts[0:-1])
-        else:
-            func_name = None
-            func_module = custom_function
-
-        from ..utils._import_module import import_module
-        module = import_module(func_module)
-
-        if module is None:
-            # we cannot find the iterator
-            Console.error(
-                f"Cannot find the iterator '{custom_function}'."
-                f"Please make sure this is spelled correctly and "
-                f"any python modules/files needed are in the "
-                f"PYTHONPATH or current directory")
-            raise ImportError(f"Could not import the iterator "
-                              f"'{custom_function}'")
-
-        if func_name is None:
-            # find the last function that starts with 'iterate'
-            import inspect
-            funcs = []
-            for name, value in inspect.getmembers(module):
-                if name.startswith("iterate"):
-                    if hasattr(value, "__call__"):
-                        if value.__module__ == module.__name__:
-                            # this is a function defined in this module
-                            funcs.append(value)
-
-            if len(funcs) > 0:
-                func = funcs[0]
-
-                if len(funcs) > 1:
-                    Console.warning(
-                        f"Multiple possible matching functions: {funcs}. "
-                        f"Choosing {func}. Please use the module::function "
-                        f"syntax if this is the wrong choice.")
-            else:
-                func = None
-
-            if func is not None:
-                return build_custom_iterator(func)
-
-            Console.error(
-                f"Could not find any function in the module "
-                f"{custom_function} that has a name that starts "
-                f"with 'iterate'. Please manually specify the "
-                f"name using the '{custom_function}::your_function syntax")
-
-            raise ImportError(f"Could not import the iterator "
-                              f"{custom_function}")
-
-        else:
-            if hasattr(module, func_name):
-                return build_custom_iterator(getattr(module, func_name))
-
-            Console.error(
-                f"Could not find the function {func_name} in the "
-                f"module {func_module}. Check that the spelling "
-                f"is correct and that the right version of the module "
-                f"is being loaded.")
-            raise ImportError(f"Could not import the iterator "
-                              f"{custom_function}")
+        custom_function = _resolve_custom_iterator(custom_function,
+                                                   parent_name)
 
     if not hasattr(custom_function, "__call__"):
         Console.error(
@@ -156,8 +162,7 @@ def build_custom_iterator(custom_function: _Union[str, MetaFunction],
     Console.print(f"Building a custom iterator for {custom_function}",
                   style="magenta")
 
-    return lambda **kwargs: iterate_custom(custom_function=custom_function,
-                                           **kwargs)
+    return _partial(iterate_custom, custom_function=custom_function)
 
 
 def iterate_custom(custom_function: MetaFunction, stage: str,
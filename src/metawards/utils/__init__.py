@@ -38,9 +38,11 @@ Functions
     move_population_from_play_to_work
     prepare_worker
     ran_binomial
+    ran_binomial_batch
     ran_int
     ran_uniform
     read_done_file
+    read_json_file
     recalculate_work_denominator_day
     recalculate_play_denominator_day
     rescale_play_matrix
@@ -56,6 +58,7 @@ Functions
     scale_link_susceptibles
     scale_node_susceptibles
     seed_ran_binomial
+    seed_ran_binomial_batch
     string_to_ints
     update_metawards
     zero_workspace
@@ -73,6 +76,7 @@ Classes
 
 from ._initialise_infections import *
 from ._read_done_file import *
+from ._read_json import *
 from ._string_to_ints import *
 from ._profiler import *
 from ._run_model import *
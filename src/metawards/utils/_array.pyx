@@ -80,6 +80,11 @@ def create_double_array(size: int, default: float=None):
     """
     cdef int s = size
     cdef array.array dbl_array
+
+    if default is not None and default == 0:
+        # quicker to let clone zero the memory in one go
+        return array.clone(_dbl_array_template, size, zero=True)
+
     dbl_array = array.clone(_dbl_array_template, size, zero=False)
 
     cdef int i
@@ -102,6 +107,11 @@ def create_int_array(size: int, default: int=None):
     """
     cdef int s = size
     cdef array.array int_array
+
+    if default is not None and default == 0:
+        # quicker to let clone zero the memory in one go
+        return array.clone(_int_array_template, size, zero=True)
+
     int_array = array.clone(_int_array_template, size, zero=False)
 
     cdef int i, d
@@ -4,6 +4,7 @@
 
 cimport cython
 from cython.parallel import parallel, prange
+from libc.stdlib cimport malloc, free
 
 from .._infections import Infections
 
@@ -19,34 +20,63 @@ def clear_all_infections(infections, play_infections,
        Parameters
        ----------
        infections
-         Space that is used to hold all of the 'work' infections
+         Space that is used to hold all of the 'work' infections.
+         This is a list of int arrays, which can each have
+         a different size (e.g. the work infections for all
+         of the demographic sub-networks)
        play_infections
-         Space that is used to hold all of the 'play' infections
+         Space that is used to hold all of the 'play' infections.
+         This is a list of int arrays, which can each have
+         a different size
        nthreads: int
          Number of threads to use to clear the arrays
     """
+    cdef int n = len(infections) + len(play_infections)
+
+    if n <= 0:
+        return
 
     cdef int i = 0
     cdef int j = 0
-    cdef int n = len(infections)
+    cdef int k = 0
+    cdef int num_threads = nthreads
 
-    if n <= 0:
-        return
+    cdef int ** ptrs = <int**>malloc(n * sizeof(int*))
+    cdef int * sizes = <int*>malloc(n * sizeof(int))
 
-    cdef int ninf = len(infections[0])
-    cdef int nplay = len(play_infections[0])
+    if ptrs == NULL or sizes == NULL:
+        free(ptrs)
+        free(sizes)
+        raise MemoryError("Unable to allocate space to clear infections")
 
-    cdef int * a
-    cdef int * b
-    cdef int num_threads = nthreads
+    try:
+        for array in infections:
+            ptrs[k] = get_int_array_ptr(array)
+            sizes[k] = len(array)
 
-    for i in range(0, n):
-        a = get_int_array_ptr(infections[i])
-        b = get_int_array_ptr(play_infections[i])
+            if ptrs[k] == NULL and sizes[k] > 0:
+                raise TypeError(f"Cannot clear {array} as it is not "
+                                f"an array of integers")
 
-        with nogil, parallel(num_threads=num_threads):
-            for j in prange(0, ninf, schedule="static"):
-                a[j] = 0
+            k += 1
+
+        for array in play_infections:
+            ptrs[k] = get_int_array_ptr(array)
+            sizes[k] = len(array)
 
-            for j in prange(0, nplay, schedule="static"):
-                b[j] = 0
+            if ptrs[k] == NULL and sizes[k] > 0:
+                raise TypeError(f"Cannot clear {array} as it is not "
+                                f"an array of integers")
+
+            k += 1
+
+        # clear all of the arrays in a single parallel region, rather
+        # than entering and leaving a parallel region per array
+        with nogil, parallel(num_threads=num_threads):
+            for i in prange(0, n, schedule="dynamic"):
+                for j in range(0, sizes[i]):
+                    ptrs[i][j] = 0
+    finally:
+        # free the buffers even if collecting the pointers failed
+        free(ptrs)
+        free(sizes)
@@ -17,6 +17,19 @@ _console = None
 # Global console theme
 _theme = None
 
+# rich classes that are used to print. These are imported
+# when they are first needed, and then cached
+_Markdown = None
+_Padding = None
+_Panel = None
+_Rule = None
+_Text = None
+
+# Whether or not printing is enabled. This is None until it is
+# first needed, when it is read from the METAWARDS_QUIET
+# environment variable
+_enabled = None
+
 
 class _NullProgress:
     """Null progress to use if user disables progress"""
@@ -176,6 +189,31 @@ class Console:
         console._debugging_enabled = bool(enabled)
         console._debugging_level = level
 
+    @staticmethod
+    def set_enabled(enabled: bool = True):
+        """Switch on or off printing to the console. This is switched
+           on by default, unless the METAWARDS_QUIET environment
+           variable is set to a true value (e.g. "1"). Errors and
+           warnings are always printed
+        """
+        global _enabled
+        _enabled = bool(enabled)
+
+    @staticmethod
+    def is_enabled():
+        """Return whether or not printing to the console is enabled.
+           Use this to avoid building expensive strings that would
+           not be printed
+        """
+        global _enabled
+
+        if _enabled is None:
+            import os
+            quiet = os.getenv("METAWARDS_QUIET", "").strip().lower()
+            _enabled = quiet in ["", "0", "false", "no", "off"]
+
+        return _enabled
+
     @staticmethod
     def set_theme(theme):
         """Set the theme used for the console - this should be
@@ -321,7 +359,11 @@ class Console:
         console = Console._get_console()
 
         if markdown:
-            from rich.markdown import Markdown as _Markdown
+            global _Markdown
+
+            if _Markdown is None:
+                from rich.markdown import Markdown as _Markdown
+
             try:
                 text = _Markdown(text)
             except Exception:
@@ -359,18 +401,39 @@ class Console:
     def print(text: str, markdown: bool = False, style: str = None,
               markup: bool = None, *args, **kwargs):
         """Print to the console"""
+        if not (_enabled or Console.is_enabled()):
+            return
+
+        Console._print(text, markdown=markdown, style=style, markup=markup)
+
+    @staticmethod
+    def _print(text: str, markdown: bool = False, style: str = None,
+               markup: bool = None, *args, **kwargs):
+        """Print to the console, even if printing has been switched
+           off. This is used to make sure that errors and warnings
+           are always printed
+        """
         if markdown:
-            from rich.markdown import Markdown as _Markdown
+            global _Markdown
+
+            if _Markdown is None:
+                from rich.markdown import Markdown as _Markdown
+
             try:
                 text = _Markdown(text)
             except Exception:
                 text = _Markdown(str(text))
 
-        theme = Console._get_theme()
+        # read the global theme and console directly, only calling
+        # the (slower) getters if these have not been created yet
+        theme = _theme if _theme is not None else Console._get_theme()
         style = theme.text(style)
 
+        console = _console if _console is not None \
+            else Console._get_console()
+
         try:
-            Console._get_console().print(text, style=style, markup=markup)
+            console.print(text, style=style, markup=markup)
         except UnicodeEncodeError:
             # this output can't cope with a complex theme - switch
             # to theme 'simple'
@@ -389,21 +452,39 @@ class Console:
     @staticmethod
     def rule(title: str = None, style=None, **kwargs):
         """Write a rule across the screen with optional title"""
-        from rich.rule import Rule as _Rule
-        Console.print("")
+        if not (_enabled or Console.is_enabled()):
+            return
+
+        Console._rule(title, style=style)
+
+    @staticmethod
+    def _rule(title: str = None, style=None):
+        """Write a rule, even if printing has been switched off"""
+        global _Rule
+
+        if _Rule is None:
+            from rich.rule import Rule as _Rule
+
+        Console._print("")
         theme = Console._get_theme()
         style = theme.rule(style)
-        Console.print(_Rule(title, style=style))
+        Console._print(_Rule(title, style=style))
 
     @staticmethod
     def panel(text: str, markdown: bool = False, width=None,
               padding: bool = True, style: str = None,
               expand=True, *args, **kwargs):
         """Print within a panel to the console"""
-        from rich.panel import Panel as _Panel
+        global _Markdown, _Padding, _Panel
+
+        if _Panel is None:
+            from rich.padding import Padding as _Padding
+            from rich.panel import Panel as _Panel
 
         if markdown:
-            from rich.markdown import Markdown as _Markdown
+            if _Markdown is None:
+                from rich.markdown import Markdown as _Markdown
+
             text = _Markdown(text)
 
         theme = Console._get_theme()
@@ -411,8 +492,6 @@ class Console:
         style = theme.panel(style)
         box = theme.panel_box(style)
 
-        from rich.padding import Padding as _Padding
-
         if padding:
             text = _Padding(text, (1, 2), style=padding_style)
         else:
@@ -425,16 +504,18 @@ class Console:
     @staticmethod
     def error(text: str, *args, **kwargs):
         """Print an error to the console"""
-        Console.rule("ERROR", style="error")
-        Console.print(text, style="error", *args, **kwargs)
-        Console.rule(style="error")
+        # errors and warnings are printed even if printing is switched off
+        Console._rule("ERROR", style="error")
+        Console._print(text, style="error", *args, **kwargs)
+        Console._rule(style="error")
 
     @staticmethod
     def warning(text: str, *args, **kwargs):
         """Print a warning to the console"""
-        Console.rule("WARNING", style="warning")
-        Console.print(text, style="warning", *args, **kwargs)
-        Console.rule(style="warning")
+        # errors and warnings are printed even if printing is switched off
+        Console._rule("WARNING", style="warning")
+        Console._print(text, style="warning", *args, **kwargs)
+        Console._rule(style="warning")
 
     @staticmethod
     def info(text: str, *args, **kwargs):
@@ -445,8 +526,12 @@ class Console:
 
     @staticmethod
     def center(text: str, *args, **kwargs):
-        from rich.text import Text as _Text
-        Console.print(_Text(str, justify="center"), *args, **kwargs)
+        global _Text
+
+        if _Text is None:
+            from rich.text import Text as _Text
+
+        Console.print(_Text(text, justify="center"), *args, **kwargs)
 
     @staticmethod
     def command(text: str, *args, **kwargs):
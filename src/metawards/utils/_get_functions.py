@@ -1,7 +1,14 @@
+from __future__ import annotations
 
+from functools import lru_cache as _lru_cache
+from functools import partial as _partial
+from inspect import signature as _signature
+from types import BuiltinFunctionType as _BuiltinFunctionType
+from types import FunctionType as _FunctionType
 from typing import Union as _Union
 from typing import Callable as _Callable
 from typing import List as _List
+from typing import Tuple as _Tuple
 
 from .._network import Network
 from .._networks import Networks
@@ -21,6 +28,32 @@ __all__ = ["get_functions", "get_model_loop_functions",
 
 MetaFunction = _Callable[..., None]
 
+# all of the stages of the model, in the order in which they are run,
+# plus a set of these names that is used to validate the stage
+_stages = ("initialise", "setup", "foi", "infect",
+           "analyse", "finalise", "summary")
+_valid_stages = frozenset(_stages)
+
+# the stages that are run, in order, during each day of the model loop
+_model_loop_stages = ("setup", "foi", "infect", "analyse")
+
+
+@_lru_cache(maxsize=1024)
+def _accepts_stage(func: MetaFunction) -> bool:
+    """Internal implementation of accepts_stage. This is cached
+       as the signature of a function will not change
+    """
+    if func.__class__ is _FunctionType and \
+            not hasattr(func, "__wrapped__") and \
+            not hasattr(func, "__signature__"):
+        # plain python function, so the arguments can be read directly
+        # from the code object rather than building a full signature
+        code = func.__code__
+        nargs = code.co_argcount + code.co_kwonlyargcount
+        return "stage" in code.co_varnames[:nargs]
+
+    return "stage" in _signature(func).parameters
+
 
 def accepts_stage(func: MetaFunction) -> bool:
     """Return whether the passed function accepts the "stage" argument,
@@ -36,10 +69,12 @@ def accepts_stage(func: MetaFunction) -> bool:
        result: bool
          Whether or not the function accepts the "stage" argument
     """
-    import inspect
-
     try:
-        return "stage" in inspect.signature(func).parameters
+        try:
+            return _accepts_stage(func)
+        except TypeError:
+            # this may be an unhashable callable, which cannot be cached
+            return _accepts_stage.__wrapped__(func)
     except Exception as e:
         from ._console import Console
         Console.error(f"Could not find the signature for {func}. The error "
@@ -52,6 +87,25 @@ def accepts_stage(func: MetaFunction) -> bool:
         raise e
 
 
+def _is_compiled(func: MetaFunction) -> bool:
+    """Return whether or not the passed function is compiled (e.g. using
+       cython), and so may release the GIL. Partials and bound methods
+       are unwrapped to find the function that will actually be called.
+       Anything else (python functions, lambdas, callable objects etc.)
+       is assumed to hold the GIL
+    """
+    while True:
+        if isinstance(func, _partial):
+            func = func.func
+        elif hasattr(func, "__func__"):
+            func = func.__func__
+        else:
+            break
+
+    return isinstance(func, _BuiltinFunctionType) or \
+        type(func).__name__ == "cython_function_or_method"
+
+
 def get_functions(stage: str,
                   network: _Union[Network, Networks],
                   population: Population,
@@ -64,7 +118,7 @@ def get_functions(stage: str,
                   mover: MetaFunction,
                   rngs, nthreads, profiler: Profiler,
                   trajectory: Populations = None,
-                  results=None) -> _List[MetaFunction]:
+                  results=None) -> _Tuple[MetaFunction, ...]:
     """Return the functions that must be called for the specified
        stage of the day;
 
@@ -117,39 +171,79 @@ def get_functions(stage: str,
 
        Returns
        -------
-       functions: List[MetaFunction]
-         The list of all functions that should be called for this
+       functions: Tuple[MetaFunction]
+         The tuple of all functions that should be called for this
          stage of the day
     """
 
-    stages = ["initialise", "setup", "foi", "infect",
-              "analyse", "finalise", "summary"]
-
-    if stage not in stages:
+    if stage not in _valid_stages:
         raise ValueError(
             f"Cannot recognise the stage {stage}. Available stages "
-            f"are {stages}")
-
-    kwargs = {"stage": stage,
-              "network": network,
-              "population": population,
-              "infections": infections,
-              "rngs": rngs,
-              "nthreads": nthreads,
-              "profiler": profiler,
-              "trajectory": trajectory,
-              "results": results}
-
-    if stage == "summary":
-        funcs = extractor(**kwargs)
-    else:
-        funcs = mover(**kwargs) + iterator(**kwargs) + \
-            mixer(**kwargs) + extractor(**kwargs)
+            f"are {list(_stages)}")
+
+    kwargs = _get_plugin_kwargs(stage=stage, network=network,
+                                population=population,
+                                infections=infections,
+                                rngs=rngs, nthreads=nthreads,
+                                profiler=profiler, trajectory=trajectory,
+                                results=results)
+
+    return tuple(_dispatch(kwargs, iterator=iterator, extractor=extractor,
+                           mixer=mixer, mover=mover))
+
+
+def _get_plugin_kwargs(stage: str,
+                       network: _Union[Network, Networks],
+                       population: Population,
+                       infections: Infections,
+                       rngs, nthreads, profiler: Profiler,
+                       trajectory: Populations = None,
+                       results=None, **kwargs):
+    """Return the dictionary of arguments that are passed to the
+       iterator, extractor, mixer and mover. Any other arguments
+       (e.g. output_dir and workspace) are not passed to these
+       plugins, so are ignored
+    """
+    return {"stage": stage,
+            "network": network,
+            "population": population,
+            "infections": infections,
+            "rngs": rngs,
+            "nthreads": nthreads,
+            "profiler": profiler,
+            "trajectory": trajectory,
+            "results": results}
+
+
+def _dispatch(kwargs, iterator: MetaFunction, extractor: MetaFunction,
+              mixer: MetaFunction,
+              mover: MetaFunction) -> _List[MetaFunction]:
+    """Return the functions for the stage held in kwargs["stage"],
+       calling the plugins with the passed (prebuilt) kwargs. The
+       stage is assumed to have already been validated
+    """
+    if kwargs["stage"] == "summary":
+        return extractor(**kwargs)
+
+    # extend a single list rather than concatenating, so that
+    # no temporary lists are created
+    funcs = []
+
+    for plugin in (mover, iterator, mixer, extractor):
+        plugin_funcs = plugin(**kwargs)
+
+        # many plugins have nothing to do for most stages
+        if plugin_funcs:
+            funcs.extend(plugin_funcs)
 
     return funcs
 
 
-def get_model_loop_functions(**kwargs) -> _List[MetaFunction]:
+def get_model_loop_functions(iterator: MetaFunction,
+                             extractor: MetaFunction,
+                             mixer: MetaFunction,
+                             mover: MetaFunction,
+                             **kwargs) -> _Tuple[MetaFunction, ...]:
     """Convenience function that returns all of the functions
        that should be called during the model loop
        (i.e. the "setup", "foi", "infect" and "analyse" stages)
@@ -180,20 +274,32 @@ def get_model_loop_functions(**kwargs) -> _List[MetaFunction]:
 
        Returns
        -------
-       functions: List[MetaFunction]
-         The list of all functions that should be called for this
+       functions: Tuple[MetaFunction]
+         The tuple of all functions that should be called for this
          stage of the day
     """
 
-    funcs = get_functions(stage="setup", **kwargs)
-    funcs += get_functions(stage="foi", **kwargs)
-    funcs += get_functions(stage="infect", **kwargs)
-    funcs += get_functions(stage="analyse", **kwargs)
+    funcs = []
 
-    return funcs
+    # build the arguments once, and then only update the stage
+    kwargs = _get_plugin_kwargs(stage=None, **kwargs)
+
+    # the functions can change from day to day (e.g. weekday/weekend
+    # or lockdown iterators), so these have to be re-fetched each day
+    for stage in _model_loop_stages:
+        kwargs["stage"] = stage
+        funcs.extend(_dispatch(kwargs, iterator=iterator,
+                               extractor=extractor, mixer=mixer,
+                               mover=mover))
 
+    return tuple(funcs)
 
-def get_initialise_functions(**kwargs) -> _List[MetaFunction]:
+
+def get_initialise_functions(iterator: MetaFunction,
+                             extractor: MetaFunction,
+                             mixer: MetaFunction,
+                             mover: MetaFunction,
+                             **kwargs) -> _Tuple[MetaFunction, ...]:
     """Convenience function that returns all of the functions
        that should be called during the initialisation step
        of the model (e.g. the "initialise" stage)
@@ -224,15 +330,22 @@ def get_initialise_functions(**kwargs) -> _List[MetaFunction]:
 
        Returns
        -------
-       functions: List[MetaFunction]
-         The list of all functions that should be called for this
+       functions: Tuple[MetaFunction]
+         The tuple of all functions that should be called for this
          stage of the day
     """
-    return get_functions(stage="initialise", **kwargs)
+    # the stage is known, so there is no need to validate it
+    return tuple(_dispatch(_get_plugin_kwargs(stage="initialise", **kwargs),
+                           iterator=iterator, extractor=extractor,
+                           mixer=mixer, mover=mover))
 
 
 def get_finalise_functions(trajectory: Populations,
-                           **kwargs) -> _List[MetaFunction]:
+                           iterator: MetaFunction,
+                           extractor: MetaFunction,
+                           mixer: MetaFunction,
+                           mover: MetaFunction,
+                           **kwargs) -> _Tuple[MetaFunction, ...]:
     """Convenience function that returns all of the functions
        that should be called during the finalisation step
        of the model (e.g. the "finalise" stage)
@@ -265,11 +378,14 @@ def get_finalise_functions(trajectory: Populations,
 
        Returns
        -------
-       functions: List[MetaFunction]
-         The list of all functions that should be called for this
+       functions: Tuple[MetaFunction]
+         The tuple of all functions that should be called for this
          stage of the day
     """
-    return get_functions(stage="finalise", **kwargs)
+    # the stage is known, so there is no need to validate it
+    return tuple(_dispatch(_get_plugin_kwargs(stage="finalise", **kwargs),
+                           iterator=iterator, extractor=extractor,
+                           mixer=mixer, mover=mover))
 
 
 def get_summary_functions(network: _Union[Network, Networks],
@@ -281,18 +397,19 @@ def get_summary_functions(network: _Union[Network, Networks],
        that should be called during the summary report
        stage of the simulation
     """
-    kwargs["workspace"] = Workspace()
     kwargs["infections"] = Infections()
     kwargs["population"] = Population()
-    kwargs["iterator"] = None
-    kwargs["mixer"] = None
-    kwargs["mover"] = None
     kwargs["rngs"] = None
     kwargs["profiler"] = None
 
-    return get_functions(stage="summary", network=network,
-                         output_dir=output_dir, results=results,
-                         extractor=extractor, nthreads=nthreads, **kwargs)
+    # only the extractor has a summary stage
+    return tuple(_dispatch(_get_plugin_kwargs(stage="summary",
+                                              network=network,
+                                              results=results,
+                                              nthreads=nthreads,
+                                              **kwargs),
+                           iterator=None, extractor=extractor,
+                           mixer=None, mover=None))
 
 
 def call_function_on_network(network: _Union[Network, Networks],
@@ -304,6 +421,7 @@ def call_function_on_network(network: _Union[Network, Networks],
                              nthreads: int = 1,
                              switch_to_parallel: int = 2,
                              call_on_overall: bool = False,
+                             subnet_parallel: bool = False,
                              **kwargs):
     """Call either 'func' or 'parallel' (depending on the
        number of threads, nthreads) on the passed Network,
@@ -322,28 +440,40 @@ def call_function_on_network(network: _Union[Network, Networks],
        switch_to_parallel: int
          Use the parallel function when nthreads is greater or equal
          to this value
+       call_on_overall: bool
+         Whether or not to also call the function on the overall
+         network after it has been called on all of the subnetworks
+       subnet_parallel: bool
+         If there is no parallel function, then call the serial
+         function on the demographic subnetworks at the same time
+         using a pool of nthreads threads. This is only useful if
+         'func' releases the GIL (e.g. it is compiled using cython
+         with nogil), and 'func' must be safe to call at the same
+         time on different subnetworks (e.g. it must not draw from
+         a shared random number generator). This is ignored unless
+         'func' is compiled (including partials or bound methods of
+         compiled functions), so python functions are always called
+         in serial
     """
     if parallel is not None:
         if func is None or nthreads >= switch_to_parallel:
             kwargs["nthreads"] = nthreads
             func = parallel
+            subnet_parallel = False
+
+    if func is None:
+        # there is nothing to call
+        return
 
-    if isinstance(network, Networks):
-        # call the function on all of the demographic sub-networks
-        for i, subnet in enumerate(network.subnets):
-            subinf = infections.subinfs[i]
-            subwork = workspace.subspaces[i]
-            subpop = population.subpops[i]
-
-            func(network=subnet, infections=subinf,
-                 population=subpop, workspace=subwork,
-                 **kwargs)
-
-        if call_on_overall:
-            func(network=network.overall, infections=infections,
-                 population=population, workspace=workspace,
-                 **kwargs)
+    if subnet_parallel and nthreads >= switch_to_parallel and \
+            _is_compiled(func):
+        subnet_threads = nthreads
     else:
-        func(network=network, infections=infections,
-             population=population, workspace=workspace,
-             **kwargs)
+        subnet_threads = 1
+
+    # Network and Networks know how to call the function on themselves
+    # (Networks calls it on each of the demographic sub-networks)
+    network.run_function(func=func, infections=infections,
+                         population=population, workspace=workspace,
+                         call_on_overall=call_on_overall,
+                         subnet_threads=subnet_threads, **kwargs)
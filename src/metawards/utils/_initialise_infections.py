@@ -19,15 +19,12 @@ def initialise_infections(network: Network):
 
     n = disease.N_INF_CLASSES()
 
-    infections = []
-
     # 'infections' holds all of the infections recorded for every
     # single link in network.links. 1-indexing is used throughout
     # the code, hence why we size for n + 1
-    for _ in range(0, n):
-        infections.append(create_int_array(network.nlinks + 1, 0.0))
+    size = network.nlinks + 1
 
-    return infections
+    return [create_int_array(size, 0) for _ in range(0, n)]
 
 
 def initialise_play_infections(network: Network):
@@ -42,12 +39,9 @@ def initialise_play_infections(network: Network):
 
     n = disease.N_INF_CLASSES()
 
-    infections = []
-
     # the 'play_infections' holds the infections that occur in
     # each ward (node) according to the 'play' rules. 1-indexing
     # is used throughout the code, hence why we size for n + 1
-    for _ in range(0, n):
-        infections.append(create_int_array(network.nnodes+1, 0.0))
+    size = network.nnodes + 1
 
-    return infections
+    return [create_int_array(size, 0) for _ in range(0, n)]
@@ -1,5 +1,6 @@
 
 from array import array
+from functools import lru_cache as _lru_cache
 from sys import platform
 
 __all__ = ["guess_num_threads_and_procs",
@@ -108,17 +109,25 @@ def get_available_num_threads():
     """Return the maximum number of threads that are recommended
        for this computer (the OMP_NUM_THREADS value)
     """
+    import os
+
+    # try OMP_NUM_THREADS as this is the accepted way to
+    # override the number in a queueing system. This is read
+    # on every call so that changes to the environment are seen
+    return _get_available_num_threads(os.getenv("OMP_NUM_THREADS", None))
+
+
+@_lru_cache(maxsize=None)
+def _get_available_num_threads(omp_num_threads: str):
+    """Return the number of available threads for the passed
+       value of OMP_NUM_THREADS. This is cached as the answer
+       does not change during a run
+    """
     from ._check_openmp import is_openmp_supported
 
     if not is_openmp_supported():
         return 1
 
-    import os
-
-    # try OMP_NUM_THREADS as this is the accepted way to
-    # override the number in a queueing system
-    omp_num_threads = os.getenv("OMP_NUM_THREADS", None)
-
     if omp_num_threads is not None:
         try:
             return int(omp_num_threads)
@@ -126,6 +135,7 @@ def get_available_num_threads():
             pass
 
     # ok, get this from 'os'
+    import os
     return os.cpu_count()
 
 
@@ -142,16 +152,16 @@ def create_thread_generators(rng, nthreads):
     if nthreads is None or nthreads <= 1:
         rngs.append(rng)
     else:
-        from ._ran_binomial import seed_ran_binomial, ran_int
+        from ._ran_binomial import seed_ran_binomial_batch
 
         from ._console import Console
 
-        lines = []
+        # construct and seed all of the generators in a single call,
+        # rather than one Python-level call per thread
+        seeds, rngs = seed_ran_binomial_batch(rng, nthreads)
 
-        for i in range(0, nthreads):
-            seed = ran_int(rng)
-            lines.append(f"* Random seed for thread {i} equals **{seed}**")
-            rngs.append(seed_ran_binomial(seed))
+        lines = [f"* Random seed for thread {i} equals **{seed}**"
+                 for i, seed in enumerate(seeds)]
 
         Console.print("\n".join(lines), markdown=True)
 
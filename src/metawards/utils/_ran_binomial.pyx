@@ -1,12 +1,19 @@
 
 
+from libc.stdint cimport uintptr_t
+
 from ._ran_binomial cimport _construct_binomial_rng, _ran_binomial, \
                             _seed_ran_binomial, _delete_binomial_rng, \
                             _get_binomial_ptr, _ran_uniform
 
 
-__all__ = ["ran_binomial", "ran_uniform", "ran_int", "ran_bool",
-           "seed_ran_binomial", "delete_ran_binomial"]
+from ._array import create_int_array
+
+from ._get_array_ptr cimport get_int_array_ptr
+
+__all__ = ["ran_binomial", "ran_binomial_batch", "ran_uniform", "ran_int",
+           "ran_bool", "seed_ran_binomial", "seed_ran_binomial_batch",
+           "delete_ran_binomial"]
 
 
 # The plan with this file is to move to an inline cdef that just
@@ -35,6 +42,41 @@ def seed_ran_binomial(seed: int = None):
     return rng
 
 
+def seed_ran_binomial_batch(rng, n: int):
+    """Create and return 'n' new random binomial generators, each
+       seeded using the next random integer drawn from 'rng'. This
+       returns a tuple of the list of seeds and the list of
+       generators. This is equivalent to, but quicker than, calling
+       seed_ran_binomial(ran_int(rng)) 'n' times, as all of the
+       generators are constructed and seeded in a single loop
+    """
+    if rng is None:
+        rng = get_global_rng()
+
+    if n <= 0:
+        return ([], [])
+
+    cdef binomial_rng *r = _get_binomial_ptr(rng)
+    cdef int cn = n
+    cdef int i = 0
+    cdef unsigned long seed = 0
+    cdef uintptr_t new_rng = 0
+
+    seeds = []
+    rngs = []
+
+    # this draws the seeds in exactly the same way as ran_int, so
+    # that the generators match those created one at a time
+    for i in range(0, cn):
+        seed = <unsigned long>(_ran_uniform(r) * 4294967296.0)
+        new_rng = _construct_binomial_rng()
+        _seed_ran_binomial(new_rng, seed)
+        seeds.append(seed)
+        rngs.append(new_rng)
+
+    return (seeds, rngs)
+
+
 _global_rng = None
 
 
@@ -61,6 +103,33 @@ def ran_binomial(rng, p: float, n: int):
     return _ran_binomial(r, p, n)
 
 
+def ran_binomial_batch(rng, p: float, n: int, size: int):
+    """Return an int array of 'size' random numbers drawn from the
+       binomial distribution [p,n]. This is equivalent to, but
+       quicker than, calling ran_binomial 'size' times
+    """
+    if rng is None:
+        rng = get_global_rng()
+
+    result = create_int_array(size, 0)
+
+    if size <= 0:
+        return result
+
+    cdef binomial_rng *r = _get_binomial_ptr(rng)
+    cdef int * values = get_int_array_ptr(result)
+    cdef double cp = p
+    cdef int cn = n
+    cdef int i = 0
+    cdef int csize = size
+
+    with nogil:
+        for i in range(0, csize):
+            values[i] = _ran_binomial(r, cp, cn)
+
+    return result
+
+
 def ran_uniform(rng):
     """Return a random double drawn from a uniform distribution between
        zero and one
@@ -7,13 +7,10 @@ def read_done_file(filename: str):
        of seeded nodes
     """
     try:
-        nodes_seeded = []
-
         with open(filename, "r") as FILE:
-            line = FILE.readline()
-
-            # each line has a single number, which is the seed
-            nodes_seeded.append(float(line.strip()))
+            # each line has a single number, which is the seed. Read
+            # and split the whole file at once rather than line by line
+            nodes_seeded = [float(word) for word in FILE.read().split()]
 
         return nodes_seeded
 
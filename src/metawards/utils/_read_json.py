@@ -0,0 +1,72 @@
+
+from functools import lru_cache as _lru_cache
+
+# use orjson to parse the json if it is available, as this is much
+# quicker. Both loads functions accept the raw bytes read from the file
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+__all__ = ["read_json_file"]
+
+
+@_lru_cache(maxsize=32)
+def _read_json_file(filename: str, mtime_ns: int, size: int):
+    """Read and parse the json in 'filename'. This is cached on
+       the absolute filename, the modification time (in nanoseconds)
+       and the size, so that a file is only re-read and re-parsed
+       if it has changed on disk
+    """
+    with open(filename, "rb") as FILE:
+        data = FILE.read()
+
+    if data.startswith(b"BZh"):
+        import bz2
+        data = bz2.decompress(data)
+
+    return _loads(data)
+
+
+def _copy_json(data):
+    """Return a copy of the passed parsed json data. This only needs
+       to copy the (mutable) dictionaries and lists
+    """
+    if isinstance(data, dict):
+        return {key: _copy_json(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_copy_json(value) for value in data]
+    else:
+        return data
+
+
+def read_json_file(filename: str, copy: bool = True):
+    """Read and return the data from the json file 'filename'. This
+       can be a plain or bzip2-compressed json file. Parsed files are
+       cached, so repeated reads of the same (unchanged) file do not
+       need to touch the disk. The returned data is a copy that
+       can be safely modified by the caller.
+
+       Parameters
+       ----------
+       filename: str
+         The name of the json file to read
+       copy: bool
+         Whether or not to return a copy of the cached data. Only
+         set this to False if the caller will not modify the data
+         (or any list or dictionary within it)
+
+       Returns
+       -------
+       data
+         The data parsed from the json file
+    """
+    import os
+    filename = os.path.abspath(filename)
+    st = os.stat(filename)
+    data = _read_json_file(filename, st.st_mtime_ns, st.st_size)
+
+    if copy:
+        return _copy_json(data)
+    else:
+        return data
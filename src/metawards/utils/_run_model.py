@@ -165,6 +165,15 @@ def run_model(network: _Union[Network, Networks],
     p = p.start("run_model_loop")
     iteration_count = 0
 
+    # the arguments passed to the model loop functions are the same
+    # every day, so are only built once. The functions themselves must
+    # be fetched each day, as iterators can return different functions
+    # on different days (e.g. weekday/weekend or lockdown iterators)
+    loop_kwargs = {"network": network, "population": population,
+                   "infections": infections, "output_dir": output_dir,
+                   "workspace": workspace, "rngs": rngs,
+                   "nthreads": nthreads}
+
     # keep looping until the outbreak is over or until we have completed
     # at least 5 loop iterations
     while (infecteds != 0) or (iteration_count < 5):
@@ -183,23 +192,15 @@ def run_model(network: _Union[Network, Networks],
         start_population = population.population
 
         funcs = get_model_loop_functions(
-            network=network, population=population,
-            infections=infections,
-            output_dir=output_dir,
-            workspace=workspace, rngs=rngs,
             iterator=iterator, extractor=extractor,
-            mixer=mixer, mover=mover,
-            nthreads=nthreads, profiler=p)
+            mixer=mixer, mover=mover, profiler=p, **loop_kwargs)
 
         should_finish_early = False
 
         for func in funcs:
             p2 = p2.start(str(func))
             try:
-                func(network=network, population=population,
-                     infections=infections, output_dir=output_dir,
-                     workspace=workspace, rngs=rngs, nthreads=nthreads,
-                     profiler=p2)
+                func(profiler=p2, **loop_kwargs)
             except StopIteration:
                 # this function has signalled that the simulation
                 # should now stop - we record this request but will
@@ -30,6 +30,9 @@ def test_console():
     Console.panel("Panel", style="alternate")
     Console.panel("Panel", style="alternate")
     Console.panel("Panel", style="header")
+    Console.panel("**Markdown** panel", markdown=True)
+    Console.print("Some *markdown*", markdown=True)
+    Console.center("Centered text")
 
     outdir = os.path.join(script_dir, "test_console")
 
@@ -86,6 +89,44 @@ def test_console():
     OutputFiles.remove(outdir, prompt=None)
 
 
+def test_console_enabled(tmpdir):
+    outdir = str(tmpdir)
+
+    assert Console.is_enabled()
+
+    with Console.redirect_output(outdir, auto_bzip=False):
+        Console.set_enabled(False)
+
+        try:
+            assert not Console.is_enabled()
+            Console.print("this should not be printed")
+            Console.rule("this rule should not be printed")
+
+            # errors and warnings must always be printed
+            Console.error("this error should be printed")
+            Console.warning("this warning should be printed")
+
+            # extra arguments are accepted and ignored, as for print
+            Console.error("this extra error should be printed", level=2)
+            Console.warning("this extra warning should be printed",
+                            True, level=2)
+        finally:
+            Console.set_enabled(True)
+
+        Console.print("this should be printed")
+
+    with open(os.path.join(outdir, "output.txt")) as FILE:
+        output = FILE.read()
+
+    assert "this should not be printed" not in output
+    assert "this rule should not be printed" not in output
+    assert "this error should be printed" in output
+    assert "this warning should be printed" in output
+    assert "this extra error should be printed" in output
+    assert "this extra warning should be printed" in output
+    assert "this should be printed" in output
+
+
 if __name__ == "__main__":
     test_spinner()
     test_console()
@@ -72,6 +72,30 @@ def test_my_custom_iterator():
 
     assert custom_funcs == default_funcs
 
+    # the functions imported from modules are cached
+    from metawards.iterators._iterate_custom import _import_custom_iterator
+    hits = _import_custom_iterator.cache_info().hits
+    custom = build_custom_iterator("test_custom_iterator::my_iterator",
+                                   __name__)
+    assert _import_custom_iterator.cache_info().hits == hits + 1
+    assert get_all(custom) == default_funcs
+
+    # but functions in the namespace are looked up every time, so
+    # that redefined functions are picked up
+    def redefined(**kwargs):
+        return my_iterator(**kwargs)
+
+    try:
+        globals()["my_redefined_iterator"] = my_iterator
+        custom = build_custom_iterator("my_redefined_iterator", __name__)
+        assert custom.keywords["custom_function"] is my_iterator
+
+        globals()["my_redefined_iterator"] = redefined
+        custom = build_custom_iterator("my_redefined_iterator", __name__)
+        assert custom.keywords["custom_function"] is redefined
+    finally:
+        globals().pop("my_redefined_iterator", None)
+
 
 if __name__ == "__main__":
     test_my_custom_iterator()
@@ -106,6 +106,16 @@ def test_disease_api():
 
     assert d == d2
 
+    d3 = d.copy()
+    assert d3 == d
+    d3.beta[1] = 0.1
+    assert d3 != d
+    assert d.beta == [0.0, 0.7, 0.3, 0.0]
+
+    assert d == d
+    assert d != "lurgy"
+    assert d is not None and d != None  # noqa: E711
+
     d2.insert(3, "I3", beta=0.1, progress=0.1)
 
     assert d != d2
@@ -118,7 +128,23 @@ def test_disease_api():
     assert d2.contrib_foi == [1.0, 1.0, 1.0, 1.0, 1.0]
 
 
+def test_disease_load_cache():
+    lurgy = Disease.load(home_json)
+    lurgy.beta[2] = 0.123
+
+    # the second load is served from the cache, but must not
+    # share any data with the first load
+    lurgy2 = Disease.load(home_json)
+
+    assert lurgy2.beta[2] != 0.123
+    assert lurgy != lurgy2
+
+    lurgy.beta[2] = lurgy2.beta[2]
+    assert lurgy == lurgy2
+
+
 if __name__ == "__main__":
     test_disease()
     test_disease_hospital()
     test_disease_api()
+    test_disease_load_cache()
@@ -44,5 +44,95 @@ def test_parameters():
     assert params == params2
 
 
+def test_parameters_construct():
+    params = Parameters()
+
+    assert params.length_day == 0.7
+    assert params.initial_inf == 5
+    assert params.user_params == {}
+
+    params = Parameters(length_day=0.5, initial_inf=10)
+
+    assert params.length_day == 0.5
+    assert params.initial_inf == 10
+
+    # mutable defaults must not be shared between instances
+    params.user_params["x"] = 1.0
+    assert Parameters().user_params == {}
+
+
+def test_parameters_load_file(tmpdir):
+    import json
+
+    filename = os.path.join(tmpdir, "params.json")
+
+    with open(filename, "w") as FILE:
+        json.dump({"name": "test", "length_day": 0.6, "UV": 1.0,
+                   "author(s)": "someone"}, FILE)
+
+    params = Parameters.load(filename=filename)
+
+    assert params.length_day == 0.6
+    assert params.UV == 1.0
+    assert params.initial_inf == 0
+    assert params.dyn_dist_cutoff == 10000000.0
+    assert params._name == "test"
+    assert params._authors == "someone"
+    assert params._version == "unknown"
+    assert params._filename == filename
+
+    # loading again (from the cache) must give the same parameters
+    assert Parameters.load(filename=filename) == params
+
+
+def test_parameters_load_many(tmpdir):
+    import json
+
+    filenames = []
+
+    for i in range(0, 5):
+        filename = os.path.join(tmpdir, f"params{i}.json")
+
+        with open(filename, "w") as FILE:
+            json.dump({"name": f"test{i}", "length_day": 0.1 * i}, FILE)
+
+        filenames.append(filename)
+
+    for nthreads in [1, 4, None]:
+        params = Parameters.load_many(filenames, nthreads=nthreads)
+
+        assert len(params) == 5
+
+        for i, p in enumerate(params):
+            assert p == Parameters.load(filename=filenames[i])
+            assert p.length_day == 0.1 * i
+            assert p._name == f"test{i}"
+
+    assert Parameters.load_many([]) == []
+
+
+def test_parameters_subparams():
+    params = Parameters()
+    params.length_day = 0.5
+
+    young = params["young"]
+    young.length_day = 0.3
+
+    assert params.specialised_demographics() == ["young"]
+    assert params["young"].length_day == 0.3
+
+    # the demographic parameters are not part of the comparison
+    assert params.copy() == params
+    assert params.copy()._subparams is None
+    assert params.copy(include_subparams=True)["young"].length_day == 0.3
+
+    params2 = pickle.loads(pickle.dumps(params))
+
+    assert params2 == params
+    assert params2["young"].length_day == 0.3
+
+
 if __name__ == "__main__":
     test_parameters()
+    test_parameters_construct()
+    test_parameters_subparams()
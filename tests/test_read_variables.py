@@ -28,7 +28,23 @@ vars1 = VariableSets()
 vars1.append(l1)
 
 
-def test_variableset():
+def _load_ncov():
+    d = Disease.load("ncov")
+
+    p = Parameters()
+    p.set_disease("ncov")
+
+    return d, p
+
+
+@pytest.fixture(scope="module")
+def ncov():
+    # the disease and parameters are only read in once for this
+    # module - set_variables returns a copy, so they are not changed
+    return _load_ncov()
+
+
+def test_variableset(ncov):
     v1 = VariableSet()
     v2 = VariableSet()
 
@@ -49,10 +65,7 @@ def test_variableset():
 
     assert v1 == v2
 
-    d = Disease.load("ncov")
-
-    p = Parameters()
-    p.set_disease("ncov")
+    d, p = ncov
 
     assert p.disease_params == d
 
@@ -67,7 +80,8 @@ def test_variableset():
                          [(0, vars0),
                           (1, vars1),
                           ([0, 1], vars01),
-                          ([1, 0], vars01)])
+                          ([1, 0], vars01)],
+                         ids=["line0", "line1", "lines01", "lines10"])
 def test_read_variables(lines, expect):
     result = Parameters.read_variables(testparams2_csv, lines)
     print(f"{result} == {expect}?")
@@ -78,8 +92,9 @@ def test_read_variables(lines, expect):
                          [(0, vars0, [2]),
                           (1, vars1, [4]),
                           ([0, 1], vars01, [2, 4]),
-                          ([1, 0], vars01, [2, 4])])
-def test_read_variables(lines, expect, repeats):
+                          ([1, 0], vars01, [2, 4])],
+                         ids=["line0", "line1", "lines01", "lines10"])
+def test_read_variables_repeats(lines, expect, repeats):
     result = Parameters.read_variables(testparams4_csv, lines)
     r = expect.repeat(repeats)
     print(f"{result} ==\n{r}?")
@@ -90,7 +105,8 @@ def test_read_variables(lines, expect, repeats):
                          [(0, vars0),
                           (1, vars1),
                           ([0, 1], vars01),
-                          ([1, 0], vars01)])
+                          ([1, 0], vars01)],
+                         ids=["line0", "line1", "lines01", "lines10"])
 def test_read_variables2(lines, expect):
     result = Parameters.read_variables(ncovparams_csv, lines)
     print(f"{result} == {expect}?")
@@ -166,11 +182,8 @@ def test_make_compatible():
         v1.make_compatible_with(v2)
 
 
-def test_set_variables():
-    d = Disease.load("ncov")
-
-    p = Parameters()
-    p.set_disease("ncov")
+def test_set_variables(ncov):
+    d, p = ncov
 
     assert p.disease_params == d
 
@@ -262,9 +275,9 @@ def test_read_edgecase():
 
 
 if __name__ == "__main__":
-    test_variableset()
+    test_variableset(_load_ncov())
     test_parameterset()
     test_make_compatible()
-    test_set_variables()
+    test_set_variables(_load_ncov())
     test_set_custom()
     test_read_edgecase()
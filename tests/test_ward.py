@@ -25,9 +25,28 @@ def test_ward_json():
 
     assert w == w2
 
+    w3 = w.copy()
+    assert w3 == w
+    w3.alternate_names.append("three")
+    assert w3 != w
+    assert w.alternate_names == ["one", "two"]
+
     ward = Ward(id=10, info=w)
 
+    assert ward.position() == {}
+    assert repr(ward) == "Ward(id=10)"
+
     ward.set_position(x=1500, y=2500, units="m")
+
+    # info() and position() return copies that can be safely changed
+    assert ward.info() == w
+    assert ward.info() is not ward.info()
+    ward.info().alternate_codes.append("dog")
+    assert ward.info() == w
+
+    pos = ward.position()
+    pos["x"] = 0.0
+    assert ward.position() == {"x": 1.5, "y": 2.5}
     ward.set_num_players(1200)
     ward.set_num_workers(500)
 
@@ -37,6 +56,33 @@ def test_ward_json():
     ward.add_player_weight(weight=0.2, destination=30)
     ward.add_player_weight(weight=0.5, destination=1)
 
+    assert ward.get_workers(30) == 20
+    assert ward.get_workers("30") == 20
+    assert ward.get_workers() == ward.get_workers(10)
+    assert ward.get_players() == ward.get_players(10)
+
+    assert ward.get_players_batch([1, 10, 30, 2]) == \
+        [ward.get_players(d) for d in [1, 10, 30, 2]]
+
+    wards, pops = ward.get_worker_lists()
+    assert list(wards) == [1, 10, 30]
+    assert list(pops) == [30, 500, 20]
+
+    wards, weights = ward.get_player_lists()
+    assert list(wards) == [1, 10, 30]
+    _assert_equal(weights[0], 0.5)
+    _assert_equal(weights[1], 0.3)
+    _assert_equal(weights[2], 0.2)
+
+    wards, weights = ward.get_player_lists(no_auto_assign=True)
+    assert list(wards) == [1, 30]
+
+    with pytest.raises(ValueError):
+        ward.get_workers(0)
+
+    with pytest.raises(ValueError):
+        ward.get_players(-1)
+
     print(ward)
 
     s = json.dumps(ward.to_data())
@@ -74,6 +120,111 @@ def test_ward_json():
     assert wards != wards2
 
 
+def test_ward_from_data_workers():
+    ward = Ward.from_data({"id": 1, "info": {"name": "test"},
+                           "workers": {"destination": [2, 3, 4],
+                                       "population": [10, 20, 30]}})
+
+    assert ward.num_workers() == 60
+    ward.assert_sane()
+
+    # a repeated destination replaces the earlier value
+    ward = Ward.from_data({"id": 1, "info": {"name": "test"},
+                           "workers": {"destination": [2, 3, 2],
+                                       "population": [10, 20, 30]}})
+
+    assert ward.get_workers(2) == 30
+    assert ward.num_workers() == 50
+    ward.assert_sane()
+
+
+def test_ward_player_weights():
+    weights = [0.1] * 10
+    destinations = list(range(1, 11))
+
+    ward = Ward.from_data({"id": 1, "info": {"name": "test"},
+                           "players": {"destination": destinations,
+                                       "weights": weights}})
+
+    # the sum of the weights is exactly 1.0, with no rounding error
+    assert ward._player_total == 0.0
+    ward.assert_sane()
+
+    # weights can be passed as any type that converts to a float
+    ward = Ward(id=1, name="test")
+    ward.add_player_weight(0.25, destination=2)
+    ward.add_player_weight("0.25", destination=3)
+    ward.add_player_weight(0, destination=4)
+
+    assert ward.get_players(2) == 0.25
+    assert ward.get_players(3) == 0.25
+    assert ward.get_players() == 0.5
+
+    for weight in [-0.1, "-1", "cat"]:
+        with pytest.raises(ValueError):
+            ward.add_player_weight(weight, destination=2)
+
+    for number in [-1, "-1", "cat", 1.5j]:
+        with pytest.raises(ValueError):
+            ward.add_workers(number, destination=2)
+
+
+def test_ward_set_id():
+    ward = Ward(name="home")
+    ward.add_workers(10)
+    ward.add_workers(5, destination=WardInfo(name="away"))
+    ward.add_player_weight(0.5)
+
+    assert not ward.is_resolved()
+
+    with pytest.raises(KeyError):
+        ward.get_worker_lists()
+
+    # the links to this ward are moved from the info to the new ID
+    ward.set_id(3)
+    assert ward.get_workers(3) == 10
+    assert ward.get_workers(WardInfo(name="away")) == 5
+    assert ward._players == {3: 0.5}
+
+    # and then from the old ID to the new ID
+    ward.set_id(7)
+    assert ward.get_workers(7) == 10
+    assert 3 not in ward._workers
+    assert ward._players == {7: 0.5}
+    assert ward.num_workers() == 15
+
+    with pytest.raises(ValueError):
+        ward.set_id(0)
+
+    # passing a Ward as the destination resolves to its ID
+    ward.add_workers(5, destination=ward)
+    assert ward.get_workers(7) == 15
+    ward.add_workers(5, destination=Ward(id=7, name="home"))
+    assert ward.get_workers(7) == 20
+
+    with pytest.raises(ValueError):
+        ward.add_workers(5, destination=Ward(id=7, name="away"))
+
+    ward.subtract_workers(8)
+    assert ward.get_workers(7) == 12
+    assert ward.num_workers() == 17
+
+    ward.subtract_workers(100, destination=WardInfo(name="away"))
+    assert ward.get_workers(WardInfo(name="away")) == 0
+    assert ward.num_work_links() == 1
+    assert ward.num_workers() == 12
+
+    # subtracting zero workers must not create a link
+    ward.subtract_workers(0, destination=WardInfo(name="nowhere"))
+    assert ward.num_work_links() == 1
+    assert ward.num_workers() == 12
+
+    other = Ward(id=1)
+    other.subtract_workers(0, destination=2)
+    assert other.num_work_links() == 0
+    assert len(other.get_worker_lists()[0]) == 0
+
+
 @pytest.mark.slow
 def test_ward_conversion():
     # load all of the parameters
@@ -197,4 +348,6 @@ def test_ward_conversion():
 
 if __name__ == "__main__":
     test_ward_json()
+    test_ward_player_weights()
+    test_ward_set_id()
     test_ward_conversion()
@@ -0,0 +1,62 @@
+
+import pytest
+
+from array import array
+
+from metawards.utils._clear_all_infections import clear_all_infections
+
+
+def test_clear_all_infections():
+    work = [array("i", [1, 2, 3]), array("i", [4])]
+    play = [array("i", [5, 6])]
+
+    clear_all_infections(work, play, nthreads=2)
+
+    for a in work + play:
+        assert list(a) == [0] * len(a)
+
+
+# get_int_array_ptr cannot raise, so reports the dtype mismatch as
+# an unraisable exception before clear_all_infections raises its error
+@pytest.mark.filterwarnings(
+    "ignore::pytest.PytestUnraisableExceptionWarning")
+def test_clear_all_infections_bad_array():
+    work = [array("i", [1, 2, 3])]
+
+    # arrays that are not integer arrays raise an error rather
+    # than crashing
+    with pytest.raises(TypeError):
+        clear_all_infections(work, [array("d", [1.0])])
+
+    with pytest.raises(TypeError):
+        clear_all_infections(work, [None])
+
+
+def test_infections_clear_reassigned():
+    from metawards import Infections
+
+    sub = Infections()
+    sub.work = [array("i", [1, 2])]
+    sub.play = [array("i", [3])]
+
+    inf = Infections()
+    inf.work = [array("i", [4, 5])]
+    inf.play = [array("i", [6])]
+    inf.subinfs = [sub]
+
+    inf.clear()
+
+    for a in inf.work + inf.play + sub.work + sub.play:
+        assert list(a) == [0] * len(a)
+
+    # the arrays can be reassigned after the infections are built,
+    # and clear must then reset the new arrays
+    old_work = inf.work
+    inf.work = [array("i", [7, 8, 9])]
+    sub.play = [array("i", [10])]
+
+    inf.clear(nthreads=2)
+
+    assert list(inf.work[0]) == [0, 0, 0]
+    assert list(sub.play[0]) == [0]
+    assert list(old_work[0]) == [0, 0]
@@ -0,0 +1,206 @@
+
+import pytest
+
+from functools import partial, wraps
+
+from metawards.utils import accepts_stage
+
+
+def _with_stage(stage, **kwargs):
+    return []
+
+
+def _without_stage(network, **kwargs):
+    return []
+
+
+def _keyword_stage(network, *, stage, **kwargs):
+    return []
+
+
+class _Callable:
+    # unhashable, so the result cannot be cached
+    __hash__ = None
+
+    def __call__(self, stage, **kwargs):
+        return []
+
+
+def test_accepts_stage():
+    assert accepts_stage(_with_stage)
+    assert not accepts_stage(_without_stage)
+    assert accepts_stage(_keyword_stage)
+
+    # the answer is cached, and should not change
+    assert accepts_stage(_with_stage)
+    assert not accepts_stage(_without_stage)
+
+    assert accepts_stage(lambda stage: [])
+    assert not accepts_stage(lambda **kwargs: [])
+
+    assert accepts_stage(partial(_with_stage))
+    assert accepts_stage(_Callable())
+
+    # decorated functions report the signature of the wrapped function
+    @wraps(_with_stage)
+    def wrapped(*args, **kwargs):
+        return _with_stage(*args, **kwargs)
+
+    assert accepts_stage(wrapped)
+
+
+def _record(network, infections, population, workspace, seen, **kwargs):
+    from threading import current_thread
+    seen.append((network, infections, population, workspace,
+                 current_thread()))
+
+
+class _Recorder:
+    def record(self, **kwargs):
+        _record(**kwargs)
+
+    def __call__(self, **kwargs):
+        _record(**kwargs)
+
+
+def test_is_compiled():
+    from metawards.utils._get_functions import _is_compiled
+    from metawards.iterators import advance_play
+
+    # compiled functions, and wrappers around them
+    assert _is_compiled(len)
+    assert _is_compiled(partial(len))
+    assert _is_compiled(partial(partial(len)))
+    assert _is_compiled(advance_play)
+    assert _is_compiled(partial(advance_play, nthreads=1))
+
+    # python functions, and wrappers around them
+    assert not _is_compiled(_record)
+    assert not _is_compiled(partial(_record))
+    assert not _is_compiled(lambda **kwargs: None)
+    assert not _is_compiled(_Recorder().record)
+    assert not _is_compiled(_Recorder())
+
+
+def _build_networks():
+    from types import SimpleNamespace
+    from metawards import Network, Networks
+
+    subnets = [Network(name=f"subnet_{i}") for i in range(4)]
+    network = Networks(overall=Network(name="overall"), subnets=subnets)
+
+    infections = SimpleNamespace(subinfs=list(range(4)))
+    population = SimpleNamespace(subpops=list(range(10, 14)))
+    workspace = SimpleNamespace(subspaces=list(range(20, 24)))
+
+    expect = [(subnets[i], i, 10 + i, 20 + i) for i in range(4)]
+
+    return network, infections, population, workspace, expect
+
+
+def test_call_function_on_subnets():
+    from threading import current_thread
+    from metawards.utils import call_function_on_network
+
+    network, infections, population, workspace, expect = _build_networks()
+
+    for nthreads in [1, 4]:
+        for func in [_record, partial(_record), _Recorder().record,
+                     _Recorder()]:
+            seen = []
+            call_function_on_network(network=network, infections=infections,
+                                     population=population,
+                                     workspace=workspace,
+                                     func=func, nthreads=nthreads,
+                                     subnet_parallel=True, seen=seen)
+
+            # python functions are always called in serial, in order
+            assert [x[:4] for x in seen] == expect
+            assert all(x[4] is current_thread() for x in seen)
+
+
+def test_run_function_on_subnet_threads():
+    from threading import current_thread
+
+    network, infections, population, workspace, expect = _build_networks()
+
+    seen = []
+    network.run_function(func=_record, infections=infections,
+                         population=population, workspace=workspace,
+                         subnet_threads=4, seen=seen)
+
+    # the threads may finish in any order
+    assert sorted([x[:4] for x in seen], key=lambda x: x[1]) == expect
+    assert all(x[4] is not current_thread() for x in seen)
+
+
+def test_get_functions_bad_stage():
+    from metawards.utils import get_functions
+
+    with pytest.raises(ValueError):
+        get_functions(stage="lunch", network=None, population=None,
+                      infections=None, output_dir=None, workspace=None,
+                      iterator=None, extractor=None, mixer=None,
+                      mover=None, rngs=None, nthreads=1, profiler=None)
+
+
+def test_subnet_thread_pool_is_reused():
+    from metawards._networks import _get_thread_pool
+
+    pool = _get_thread_pool(2)
+    assert _get_thread_pool(2) is pool
+
+    # changing the number of threads creates a new pool
+    pool3 = _get_thread_pool(3)
+    assert pool3 is not pool
+    assert _get_thread_pool(3) is pool3
+
+
+def test_call_function_on_network_no_function():
+    from metawards import Network
+    from metawards.utils import call_function_on_network
+
+    # this should be a no-op rather than trying to call None
+    call_function_on_network(network=Network(), infections=None,
+                             population=None, workspace=None,
+                             func=None, parallel=None, nthreads=4)
+
+
+def _plugin(name):
+    def plugin(stage, **kwargs):
+        return [f"{name}_{stage}"]
+
+    return plugin
+
+
+def test_get_stage_functions():
+    from metawards.utils import get_initialise_functions, \
+        get_model_loop_functions, get_finalise_functions, \
+        get_summary_functions
+
+    plugins = {"iterator": _plugin("iterate"),
+               "extractor": _plugin("extract"),
+               "mixer": _plugin("mix"),
+               "mover": _plugin("move")}
+
+    kwargs = {"network": None, "population": None, "infections": None,
+              "output_dir": None, "workspace": None, "rngs": None,
+              "nthreads": 1, "profiler": None}
+
+    def expect(*stages):
+        return tuple(f"{name}_{stage}" for stage in stages
+                     for name in ["move", "iterate", "mix", "extract"])
+
+    assert get_initialise_functions(**plugins, **kwargs) == \
+        expect("initialise")
+
+    assert get_model_loop_functions(**plugins, **kwargs) == \
+        expect("setup", "foi", "infect", "analyse")
+
+    assert get_finalise_functions(trajectory=None, **plugins, **kwargs) == \
+        expect("finalise")
+
+    assert get_summary_functions(network=None, results=None,
+                                 output_dir=None,
+                                 extractor=plugins["extractor"]) == \
+        ("extract_summary",)
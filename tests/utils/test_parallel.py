@@ -3,6 +3,7 @@ import pytest
 
 from metawards.utils import guess_num_threads_and_procs
 from metawards.utils import is_openmp_supported
+from metawards.utils import get_available_num_threads
 
 
 @pytest.mark.parametrize('args, expected',
@@ -36,3 +37,20 @@ def test_no_omp(args, expected):
                                              nprocs=args[2],
                                              ncores=args[3])
         assert result == expected
+
+
+def test_available_num_threads(monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "3")
+
+    if is_openmp_supported():
+        assert get_available_num_threads() == 3
+    else:
+        assert get_available_num_threads() == 1
+
+    # the value is cached, but changes to the environment are still seen
+    monkeypatch.setenv("OMP_NUM_THREADS", "5")
+
+    if is_openmp_supported():
+        assert get_available_num_threads() == 5
+    else:
+        assert get_available_num_threads() == 1
@@ -34,5 +34,47 @@ def test_ran_binomial():
     # I think we can trust is correct
 
 
+def test_ran_binomial_batch():
+    seed = 15324
+
+    rng = metawards.utils.seed_ran_binomial(seed)
+    expect = [metawards.utils.ran_binomial(rng, 0.5, 100) for _ in range(10)]
+    metawards.utils.delete_ran_binomial(rng)
+
+    rng = metawards.utils.seed_ran_binomial(seed)
+    result = metawards.utils.ran_binomial_batch(rng, 0.5, 100, 10)
+    metawards.utils.delete_ran_binomial(rng)
+
+    assert list(result) == expect
+
+
+def test_seed_ran_binomial_batch():
+    seed = 15324
+
+    rng = metawards.utils.seed_ran_binomial(seed)
+    expect_seeds = [metawards.utils.ran_int(rng) for _ in range(4)]
+    expect = []
+
+    for s in expect_seeds:
+        r = metawards.utils.seed_ran_binomial(s)
+        expect.append(metawards.utils.ran_binomial(r, 0.5, 100))
+        metawards.utils.delete_ran_binomial(r)
+
+    metawards.utils.delete_ran_binomial(rng)
+
+    rng = metawards.utils.seed_ran_binomial(seed)
+    seeds, rngs = metawards.utils.seed_ran_binomial_batch(rng, 4)
+    metawards.utils.delete_ran_binomial(rng)
+
+    assert seeds == expect_seeds
+    assert len(rngs) == 4
+
+    for r, e in zip(rngs, expect):
+        assert metawards.utils.ran_binomial(r, 0.5, 100) == e
+        metawards.utils.delete_ran_binomial(r)
+
+
 if __name__ == "__main__":
     test_ran_binomial()
+    test_ran_binomial_batch()
+    test_seed_ran_binomial_batch()
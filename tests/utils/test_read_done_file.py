@@ -0,0 +1,15 @@
+
+import pytest
+from metawards.utils import read_done_file
+
+
+def test_read_done_file(tmpdir):
+    filename = tmpdir.join("done_file.dat")
+    filename.write("5\n12\n\n 7 \n")
+
+    assert read_done_file(str(filename)) == [5.0, 12.0, 7.0]
+
+    filename.write("5\nnot a number\n")
+
+    with pytest.raises(ValueError):
+        read_done_file(str(filename))
@@ -0,0 +1,35 @@
+
+import os
+
+from metawards.utils import read_json_file
+
+
+def test_read_json_file(tmpdir, monkeypatch):
+    filename = os.path.join(tmpdir, "test.json")
+
+    with open(filename, "w") as FILE:
+        FILE.write('{"a": 1}')
+
+    st = os.stat(filename)
+    assert read_json_file(filename) == {"a": 1}
+
+    # a rewrite within the same mtime tick must still be seen
+    with open(filename, "w") as FILE:
+        FILE.write('{"a": 10}')
+
+    os.utime(filename, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert read_json_file(filename) == {"a": 10}
+
+    # the same relative name in different directories are different files
+    for (i, d) in enumerate(["one", "two"]):
+        os.makedirs(os.path.join(tmpdir, d))
+
+        with open(os.path.join(tmpdir, d, "test.json"), "w") as FILE:
+            FILE.write(f'{{"b": {i}}}')
+
+        os.utime(os.path.join(tmpdir, d, "test.json"),
+                 ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    for (i, d) in enumerate(["one", "two"]):
+        monkeypatch.chdir(os.path.join(tmpdir, d))
+        assert read_json_file("test.json") == {"b": i}